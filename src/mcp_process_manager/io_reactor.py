@@ -0,0 +1,230 @@
+"""
+Shared I/O reactor for reading process output.
+
+This module provides the IOReactor class which multiplexes the output pipes of
+every managed process on a single selector and thread, instead of running
+dedicated reader threads per process.
+"""
+
+import os
+import heapq
+import itertools
+import selectors
+import threading
+import time
+import logging
+from collections import deque
+from typing import Callable, Optional
+
+logger = logging.getLogger("mcp_process_manager.io_reactor")
+
+# Maximum number of bytes read from a pipe in a single syscall
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class IOReactor:
+    """
+    Reads from many non-blocking file descriptors on one background thread.
+
+    Readers are registered with a callback that receives each chunk of data
+    read from the descriptor, and an empty bytes object once the descriptor
+    reaches end of file (at which point it has already been unregistered).
+    Descriptors that are only waited on, such as pidfds, can be watched with
+    call_when_readable(). Timers can be scheduled with call_later(). All
+    callbacks run on the reactor thread, so they must not block.
+
+    All methods are thread-safe; changes requested from other threads are
+    handed to the reactor thread, which applies them between selects.
+
+    Example usage:
+        reactor = get_reactor()
+        os.set_blocking(fd, False)
+        reactor.add_reader(fd, lambda data: print(data))
+    """
+
+    def __init__(self):
+        """Initialize a new reactor. The thread is started on first use."""
+        self.selector = selectors.DefaultSelector()
+        self.lock = threading.Lock()
+        self.thread = None
+
+        # Changes requested from other threads, applied by the reactor thread.
+        # deque.append() and popleft() are atomic, so no extra lock is needed;
+        # the wakeup pipe does the signalling.
+        self._pending = deque()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        self.selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+
+        # Heap of (deadline, sequence, callback), owned by the reactor thread
+        self._timers = []
+        self._timer_seq = itertools.count()
+
+        # Set up logger
+        self.logger = logger
+        self.logger.info("IOReactor initialized")
+
+    def _submit(self, op: tuple) -> None:
+        """
+        Hand a change to the reactor thread and wake it up.
+
+        Args:
+            op: Operation tuple, interpreted by _apply_pending()
+        """
+        self._pending.append(op)
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="mcp-io-reactor", daemon=True)
+                self.thread.start()
+                self.logger.debug("Started reactor thread")
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:
+            # The pipe is full, so the reactor is already due to wake up
+            pass
+
+    def add_reader(self, fd: int, callback: Callable[[bytes], None]) -> None:
+        """
+        Start reading from a non-blocking file descriptor.
+
+        Args:
+            fd: File descriptor to read from
+            callback: Called with each chunk read, and with b"" at end of file
+        """
+        self._submit(("add", fd, callback, True))
+
+    def call_when_readable(self, fd: int, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once a file descriptor becomes readable, without reading from it.
+
+        The descriptor is unregistered before the callback runs.
+
+        Args:
+            fd: File descriptor to wait on
+            callback: Function to call
+        """
+        self._submit(("add", fd, callback, False))
+
+    def remove_reader(self, fd: int, callback: Callable[[bytes], None],
+                      on_removed: Optional[Callable[[], None]] = None) -> None:
+        """
+        Stop reading from or waiting on a file descriptor.
+
+        The reader is only removed if it is still registered with an equal
+        callback, so a descriptor number reused after end of file is never
+        affected. Callbacks are compared with ==, so a bound method matches
+        the one registered even when it is looked up again. on_removed runs
+        on the reactor thread once the descriptor is no longer being
+        watched, which makes it the safe place to close it.
+
+        Args:
+            fd: File descriptor passed to add_reader() or call_when_readable()
+            callback: Callback passed with it
+            on_removed: Optional function to call after removal
+        """
+        self._submit(("remove", fd, callback, on_removed))
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        """
+        Run a callback on the reactor thread after a delay.
+
+        Args:
+            delay: Delay in seconds
+            callback: Function to call
+        """
+        deadline = time.monotonic() + delay
+        if threading.current_thread() is self.thread:
+            heapq.heappush(self._timers, (deadline, next(self._timer_seq), callback))
+        else:
+            self._submit(("timer", deadline, callback))
+
+    def _apply_pending(self) -> None:
+        """Apply the changes requested by other threads."""
+        pending = self._pending
+        while pending:
+            op = pending.popleft()
+            if op[0] == "add":
+                _, fd, callback, read = op
+                self.selector.register(fd, selectors.EVENT_READ, (callback, read))
+                self.logger.debug("Added reader: fd=%s", fd)
+            elif op[0] == "remove":
+                _, fd, callback, on_removed = op
+                key = self.selector.get_map().get(fd)
+                # Bound methods are created anew on each lookup, so compare with ==
+                if key is not None and key.data[0] == callback:
+                    self.selector.unregister(fd)
+                    self.logger.debug("Removed reader: fd=%s", fd)
+                if on_removed is not None:
+                    self._invoke(on_removed)
+            elif op[0] == "timer":
+                _, deadline, callback = op
+                heapq.heappush(self._timers, (deadline, next(self._timer_seq), callback))
+
+    def _invoke(self, callback: Callable, *args) -> None:
+        """Run a callback, logging instead of propagating any error."""
+        try:
+            callback(*args)
+        except Exception as e:
+            self.logger.error(f"Error in reactor callback: {str(e)}", exc_info=True)
+
+    def _run(self) -> None:
+        """Main loop of the reactor thread."""
+        while True:
+            try:
+                self._apply_pending()
+
+                timeout = None
+                if self._timers:
+                    timeout = max(0.0, self._timers[0][0] - time.monotonic())
+
+                for key, _ in self.selector.select(timeout):
+                    if key.data is None:  # Woken up by _submit()
+                        try:
+                            os.read(self._wakeup_r, READ_CHUNK_SIZE)
+                        except BlockingIOError:
+                            pass
+                        continue
+
+                    callback, read = key.data
+                    if not read:
+                        self.selector.unregister(key.fd)
+                        self._invoke(callback)
+                        continue
+
+                    try:
+                        data = os.read(key.fd, READ_CHUNK_SIZE)
+                    except BlockingIOError:
+                        continue
+                    except OSError as e:
+                        self.logger.error(f"Error reading fd={key.fd}: {str(e)}")
+                        data = b""
+
+                    if not data:  # End of file
+                        self.selector.unregister(key.fd)
+                    self._invoke(callback, data)
+
+                now = time.monotonic()
+                while self._timers and self._timers[0][0] <= now:
+                    _, _, callback = heapq.heappop(self._timers)
+                    self._invoke(callback)
+            except Exception as e:
+                self.logger.error(f"Error in reactor loop: {str(e)}", exc_info=True)
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+
+
+def get_reactor() -> IOReactor:
+    """
+    Get the process-wide reactor, creating it on first use.
+
+    Returns:
+        The shared IOReactor instance
+    """
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = IOReactor()
+        return _reactor
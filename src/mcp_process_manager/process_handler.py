@@ -5,13 +5,132 @@ This module provides the ProcessHandler class which manages the lifecycle
 of a single process, including its I/O operations and buffer management.
 """
 
+import os
+import fnmatch
 import subprocess
 import threading
 import time
-import queue
 import logging
-from typing import List, Dict, Tuple, Optional, Any
-from .ring_buffer import RingBuffer
+from typing import List, Dict, Tuple, Optional, Any, Union, Pattern
+from .ring_buffer import RingBuffer, cached_regex
+from .io_reactor import get_reactor
+
+logger = logging.getLogger("mcp_process_manager.process_handler")
+
+# Seconds to wait for the rest of a line before buffering it as a partial line
+PARTIAL_LINE_TIMEOUT = 0.1
+
+# Seconds between exit checks on platforms where exit cannot be watched
+# through a pidfd
+EXIT_POLL_INTERVAL = 0.05
+
+# Seconds to keep reading output after a process exits before recording its
+# exit state, when its output pipes are still held open by a background child
+EXIT_OUTPUT_GRACE = 0.1
+
+
+class _OutputStream:
+    """
+    Splits the output of one pipe into lines for a ProcessHandler.
+
+    Every method except close() runs on the shared reactor thread.
+    """
+
+    def __init__(self, handler: "ProcessHandler", pipe, source: str):
+        """
+        Initialize a new output stream.
+
+        Args:
+            handler: Handler whose buffer receives the lines
+            pipe: Pipe object to read from
+            source: Name of the stream, used for logging
+        """
+        self.handler = handler
+        self.pipe = pipe
+        self.source = source
+        self.fd = pipe.fileno()
+        # Trailing partial line carried over to the next chunk. The same
+        # bytearray is reused for the lifetime of the stream.
+        self.partial = bytearray()
+        self.last_read = 0.0
+        self.flush_scheduled = False
+
+    def open(self) -> None:
+        """Start reading the pipe on the shared reactor."""
+        os.set_blocking(self.fd, False)
+        get_reactor().add_reader(self.fd, self.on_data)
+
+    def close(self) -> None:
+        """Stop reading the pipe and close it once the reactor no longer watches it."""
+        get_reactor().remove_reader(self.fd, self.on_data, self.pipe.close)
+
+    def on_data(self, data: bytes) -> None:
+        """
+        Add every complete line in a chunk of output to the buffer in one batch.
+
+        A trailing partial line is carried over to the next chunk, or added to
+        the buffer on its own if no more output arrives within
+        PARTIAL_LINE_TIMEOUT seconds so that prompts without a newline can
+        still be detected.
+
+        Args:
+            data: Chunk read from the pipe, or b"" at end of file
+        """
+        handler = self.handler
+        try:
+            if not data:  # End of stream
+                handler.logger.debug("End of %s stream", self.source)
+                self.pipe.close()
+                if self.partial:
+                    handler._append_partial_line(self.partial)
+                    self.partial.clear()
+                handler._on_stream_closed()
+                return
+
+            lines = []
+            current_line = self.partial
+            view = memoryview(data)
+            start = 0
+            end = data.find(b'\n')
+            if end != -1 and current_line:
+                # Only the first line needs joining with the leftover
+                current_line.extend(view[:end + 1])
+                lines.append(bytes(current_line))
+                current_line.clear()
+                start = end + 1
+                end = data.find(b'\n', start)
+            while end != -1:
+                lines.append(data[start:end + 1])
+                start = end + 1
+                end = data.find(b'\n', start)
+            current_line.extend(view[start:])
+            if lines:
+                handler.buffer.extend(lines)
+                handler.logger.debug("Added %d complete lines to buffer", len(lines))
+            if current_line:
+                self.last_read = time.monotonic()
+                if not self.flush_scheduled:
+                    self.flush_scheduled = True
+                    get_reactor().call_later(PARTIAL_LINE_TIMEOUT, self._flush_partial)
+        except Exception as e:
+            with handler.lock:
+                handler.error = str(e)
+                handler.state = "error"
+            handler.logger.error("Error reading %s: %s", self.source, e, exc_info=True)
+
+    def _flush_partial(self) -> None:
+        """Add the partial line to the buffer if it has not been completed in time."""
+        self.flush_scheduled = False
+        if not self.partial:
+            return
+        remaining = self.last_read + PARTIAL_LINE_TIMEOUT - time.monotonic()
+        if remaining > 0:
+            # More output arrived since the flush was scheduled
+            self.flush_scheduled = True
+            get_reactor().call_later(remaining, self._flush_partial)
+            return
+        self.handler._append_partial_line(self.partial)
+        self.partial.clear()
 
 
 class ProcessHandler:
@@ -41,24 +160,35 @@ class ProcessHandler:
         self.state = "initialized"
         self.error = None
         self.buffer = RingBuffer(max_size_bytes=buffer_size)
+        self._status_tail = (-1, "")  # (buffer version, last output) from the last get_status
 
-        # I/O handling
-        self.stdout_thread = None
-        self.stderr_thread = None
-        self.io_queue = queue.Queue()
+        # I/O handling. Output is read on the shared reactor thread.
         self.stop_event = threading.Event()
+        self._streams = ()
+        self._open_streams = 0  # Only updated on the reactor thread
+        self._pidfd = None  # Becomes readable when the process exits (Linux only); closed on the reactor thread
+        self._exit_code = None  # Set on the reactor thread once the process has exited
+        self._stdin_fd = None  # Raw stdin descriptor, written without Python-level buffering
+
+        # Lock for process state transitions. It is never re-entered, so a
+        # plain Lock suffices; the buffer is guarded by its own lock.
+        self.lock = threading.Lock()
+
+        # Serializes stdin writes, which can block on a full pipe, so they
+        # never hold up state changes or status queries
+        self._stdin_lock = threading.Lock()
 
-        # Lock for thread safety
-        self.lock = threading.RLock()
+        # The command never changes, so truncate it for logging only once
+        self._command_repr = self._truncate_for_logging(command)
 
         # Set up logger
-        self.logger = logging.getLogger("mcp_process_manager.process_handler")
-        self.logger.info(f"ProcessHandler initialized: command={self._truncate_for_logging(command)}")
+        self.logger = logger
+        self.logger.debug("ProcessHandler initialized: command=%s", self._command_repr)
 
     def _truncate_for_logging(self, value, max_length=50):
         """Truncate a value for logging purposes."""
-        if isinstance(value, str) and len(value) > max_length:
-            return value[:max_length - 3] + "..."
+        if isinstance(value, (str, bytes)) and len(value) > max_length:
+            return value[:max_length - 3] + ("..." if isinstance(value, str) else b"...")
         elif isinstance(value, list):
             return [self._truncate_for_logging(item) for item in value[:5]] + (["..."] if len(value) > 5 else [])
         return value
@@ -74,7 +204,7 @@ class ProcessHandler:
             Tuple of (status, pid) where status is "success" or "failed: {error}"
             and pid is the process ID or None if failed
         """
-        self.logger.info(f"Starting process: timeout={timeout}")
+        self.logger.info("Starting process: timeout=%s", timeout)
         try:
             with self.lock:
                 if self.process is not None:
@@ -88,7 +218,7 @@ class ProcessHandler:
                     return f"failed: {error_msg}", None
 
                 # Start the process
-                self.logger.debug(f"Executing command: {self._truncate_for_logging(self.command)}")
+                self.logger.debug("Executing command: %s", self._command_repr)
                 try:
                     self.process = subprocess.Popen(
                         self.command,
@@ -125,127 +255,145 @@ class ProcessHandler:
 
                 self.pid = self.process.pid
                 self.state = "running"
-                self.logger.info(f"Process started: pid={self.pid}")
+                self._stdin_fd = self.process.stdin.fileno()
+                self._pidfd = self._open_pidfd(self.pid)
+                self.logger.info("Process started: pid=%s", self.pid)
 
-                # Start reader threads
+                # Read stdout and stderr on the shared reactor thread
                 self.stop_event.clear()
-                self.stdout_thread = threading.Thread(
-                    target=self._read_output,
-                    args=(self.process.stdout, "stdout"),
-                    daemon=True
+                self._streams = (
+                    _OutputStream(self, self.process.stdout, "stdout"),
+                    _OutputStream(self, self.process.stderr, "stderr"),
                 )
-                self.stderr_thread = threading.Thread(
-                    target=self._read_output,
-                    args=(self.process.stderr, "stderr"),
-                    daemon=True
-                )
-
-                self.logger.debug("Starting stdout and stderr reader threads")
-                self.stdout_thread.start()
-                self.stderr_thread.start()
-
-                # Start processor thread
-                self.processor_thread = threading.Thread(
-                    target=self._process_output,
-                    daemon=True
-                )
-                self.processor_thread.start()
-                self.logger.debug("Started output processor thread")
+                self._open_streams = len(self._streams)
+                self.logger.debug("Registering output streams with the reactor")
+                for stream in self._streams:
+                    stream.open()
+
+                # Watch for exit independently of the streams, which a
+                # background child may keep open after the process exits
+                if self._pidfd is not None:
+                    get_reactor().call_when_readable(self._pidfd, self._check_exit)
+                else:
+                    get_reactor().call_later(EXIT_POLL_INTERVAL, self._check_exit)
 
                 return "success", self.pid
 
         except Exception as e:
             self.state = "error"
             self.error = str(e)
-            self.logger.error(f"Failed to start process: {str(e)}", exc_info=True)
+            self.logger.error("Failed to start process: %s", e, exc_info=True)
             return f"failed: {str(e)}", None
 
-    def _read_output(self, pipe: Any, source: str) -> None:
+    def _open_pidfd(self, pid: int) -> Optional[int]:
         """
-        Read output from the process one byte at a time.
+        Open a descriptor that becomes readable when the process exits.
 
         Args:
-            pipe: Pipe to read from (stdout or stderr)
-            source: Source identifier ("stdout" or "stderr")
+            pid: Process ID
+
+        Returns:
+            The pidfd, or None if the platform does not support pidfds
         """
-        self.logger.debug(f"Started {source} reader thread")
+        if not hasattr(os, "pidfd_open"):
+            return None
         try:
-            while not self.stop_event.is_set():
-                byte = pipe.read(1)
-                if not byte:  # End of stream
-                    self.logger.debug(f"End of {source} stream")
-                    break
+            return os.pidfd_open(pid)
+        except OSError as e:
+            self.logger.debug("pidfd_open unavailable, exit will be polled: %s", e)
+            return None
+
+    def _close_pidfd(self) -> None:
+        """Close the pidfd if it is still open. Runs on the reactor thread."""
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def _on_stream_closed(self) -> None:
+        """Record the exit state once the process has exited and both output streams have reached end of file. Runs on the reactor thread."""
+        self._open_streams -= 1
+        if self._open_streams == 0 and self._exit_code is not None:
+            self._record_exit()
+
+    def _check_exit(self) -> None:
+        """
+        Note the exit code of the process, checking again later if it is still running.
 
-                self.io_queue.put((source, byte))
-        except Exception as e:
-            self.logger.error(f"Error in {source} reader: {str(e)}", exc_info=True)
-            self.io_queue.put(("error", str(e)))
-        finally:
-            self.logger.debug(f"Closing {source} pipe")
-            pipe.close()
+        Without a pidfd the reactor thread, which must never block, polls the
+        process every EXIT_POLL_INTERVAL seconds instead of waiting for it.
+        The exit state is recorded once the output streams reach end of file,
+        or after EXIT_OUTPUT_GRACE seconds if a background child still holds
+        them open, so output written before the exit is buffered first.
+        """
+        if self.stop_event.is_set():
+            return
+        # poll() rather than waitid() on the pidfd, so Popen reaps the process and keeps its exit code
+        exit_code = self.process.poll()
+        if exit_code is None:
+            if self._pidfd is not None:
+                get_reactor().call_when_readable(self._pidfd, self._check_exit)
+            else:
+                get_reactor().call_later(EXIT_POLL_INTERVAL, self._check_exit)
+            return
+        self._close_pidfd()
+        self._exit_code = exit_code
+        if self._open_streams == 0:
+            self._record_exit()
+        else:
+            get_reactor().call_later(EXIT_OUTPUT_GRACE, self._record_exit)
+
+    def _record_exit(self) -> None:
+        """Move the process to its final state with the exit code noted by _check_exit(). Runs on the reactor thread."""
+        if not self.stop_event.is_set():
+            self._update_exit_state(self._exit_code)
+
+    def _append_partial_line(self, line: bytearray) -> None:
+        """
+        Add a line of raw output that is missing its trailing newline to the buffer.
 
-    def _process_output(self) -> None:
-        """Process output bytes from the queue and add to buffer."""
-        self.logger.debug("Started output processor thread")
-        current_line = bytearray()
+        Lines are stored undecoded; decoding happens when output is read back.
 
-        try:
-            while not self.stop_event.is_set():
-                try:
-                    source, data = self.io_queue.get(timeout=0.1)
-
-                    if source == "error":
-                        with self.lock:
-                            self.error = data
-                            self.state = "error"
-                            self.logger.error(f"Error in IO processing: {data}")
-                        continue
-
-                    # Add byte to current line
-                    if isinstance(data, bytes):
-                        current_line.extend(data)
-
-                        # If we have a newline, add the complete line to buffer
-                        if data == b'\n':
-                            with self.lock:
-                                line = current_line.decode('utf-8', errors='replace')
-                                self.buffer.append(line)
-                                self.logger.debug(f"Added complete line to buffer: {self._truncate_for_logging(line)}")
-                            current_line = bytearray()
-
-                    self.io_queue.task_done()
-
-                except queue.Empty:
-                    # If we have data in current_line, add it to buffer even without newline
-                    # This allows detecting prompts that don't end with newline
-                    if current_line:
-                        with self.lock:
-                            line = current_line.decode('utf-8', errors='replace')
-                            self.buffer.append(line)
-                            self.logger.debug(f"Added partial line to buffer: {self._truncate_for_logging(line)}")
-                        current_line = bytearray()
-
-                    # Check if process has terminated
-                    with self.lock:
-                        if self.process and self.process.poll() is not None:
-                            if self.state == "running":
-                                exit_code = self.process.poll()
-                                if exit_code == 0:
-                                    self.state = "completed"
-                                    self.logger.info(f"Process completed: pid={self.pid}, exit_code={exit_code}")
-                                else:
-                                    self.state = f"error: Exit code {exit_code}"
-                                    self.logger.warning(f"Process error: pid={self.pid}, exit_code={exit_code}")
-
-                            # Only exit if we've processed all queued output
-                            if self.io_queue.empty():
-                                self.logger.debug("Output queue empty, processor thread exiting")
-                                break
-        except Exception as e:
-            with self.lock:
-                self.error = str(e)
-                self.state = "error"
-                self.logger.error(f"Error in output processor: {str(e)}", exc_info=True)
+        Args:
+            line: Raw bytes of the line
+        """
+        data = bytes(line)
+        self.buffer.append(data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Added partial line to buffer: %s", self._truncate_for_logging(data))
+
+    def _update_exit_state(self, exit_code: Optional[int]) -> None:
+        """
+        Move a running process to its final state once it has exited.
+
+        Args:
+            exit_code: Exit code of the process, or None if it is still running
+        """
+        # Nothing to record while the process is still running
+        if exit_code is None:
+            return
+        with self.lock:
+            self._set_exit_state(exit_code)
+
+    def _set_exit_state(self, exit_code: Optional[int]) -> None:
+        """
+        Move a running process to its final state. The caller must hold self.lock.
+
+        Args:
+            exit_code: Exit code of the process, or None if it is still running
+        """
+        if exit_code is None or self.state != "running":
+            return
+        if exit_code == 0:
+            self.state = "completed"
+            self.logger.info("Process completed: pid=%s, exit_code=%s", self.pid, exit_code)
+        else:
+            self.state = f"error: Exit code {exit_code}"
+            self.logger.warning("Process error: pid=%s, exit_code=%s", self.pid, exit_code)
+
+    @property
+    def output_version(self) -> int:
+        """Counter that changes whenever the buffered output changes."""
+        return self.buffer.version
 
     def get_status(self, timeout: float = 15.0) -> Dict[str, Any]:
         """
@@ -257,31 +405,31 @@ class ProcessHandler:
         Returns:
             Dictionary with process status information
         """
-        self.logger.debug(f"Getting process status: pid={self.pid}, timeout={timeout}")
+        self.logger.debug("Getting process status: pid=%s, timeout=%s", self.pid, timeout)
         with self.lock:
             # Update process state if needed
             if self.process and self.state == "running":
-                exit_code = self.process.poll()
-                if exit_code is not None:
-                    if exit_code == 0:
-                        self.state = "completed"
-                        self.logger.info(f"Process completed: pid={self.pid}, exit_code={exit_code}")
-                    else:
-                        self.state = f"error: Exit code {exit_code}"
-                        self.logger.warning(f"Process error: pid={self.pid}, exit_code={exit_code}")
-
-            # Get last few lines of output
+                self._set_exit_state(self.process.poll())
+
+            state = self.state
+
+        # Get last few lines of output (the buffer has its own lock), only
+        # rebuilding them if output has been added since the last call
+        version = self.buffer.version
+        cached_version, last_output = self._status_tail
+        if version != cached_version:
             last_lines = self.buffer.get_lines(5)
             last_output = "".join(last_lines)
             if len(last_output) > 300:
                 last_output = last_output[-300:]
+            self._status_tail = (version, last_output)
 
-            self.logger.debug(f"Process status: pid={self.pid}, state={self.state}")
-            return {
-                "command": self.command,
-                "state": self.state,
-                "last_five_lines": last_output
-            }
+        self.logger.debug("Process status: pid=%s, state=%s", self.pid, state)
+        return {
+            "command": self.command,
+            "state": state,
+            "last_five_lines": last_output
+        }
 
     def kill(self, timeout: float = 15.0) -> str:
         """
@@ -293,65 +441,79 @@ class ProcessHandler:
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Killing process: pid={self.pid}, timeout={timeout}")
+        self.logger.info("Killing process: pid=%s, timeout=%s", self.pid, timeout)
         try:
             with self.lock:
                 if not self.process:
                     self.logger.warning("No process to kill")
                     return "failed: No process to kill"
 
+                # Keep the exit code of a process that has already exited,
+                # even if the reactor has not recorded it yet
+                if self.state == "running":
+                    self._set_exit_state(self.process.poll())
+
                 if self.state not in ["running", "error"]:
-                    self.logger.warning(f"Process not in killable state: state={self.state}")
+                    self.logger.warning("Process not in killable state: state=%s", self.state)
                     return "failed: Process not running"
 
                 # Kill the process
-                self.logger.debug(f"Sending kill signal to process: pid={self.pid}")
-                self.process.kill()
-
-                # Wait for process to terminate
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    if self.process.poll() is not None:
-                        break
-                    time.sleep(0.1)
+                self.logger.debug("Sending kill signal to process: pid=%s", self.pid)
+                process = self.process
+                process.kill()
 
-                # Check if process terminated
-                if self.process.poll() is None:
-                    self.logger.error(f"Process did not terminate within timeout: pid={self.pid}")
-                    return "failed: Process did not terminate within timeout"
+            # Wait for process to terminate without holding the lock, so
+            # status and output queries are not blocked in the meantime
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.logger.error("Process did not terminate within timeout: pid=%s", self.pid)
+                return "failed: Process did not terminate within timeout"
 
+            with self.lock:
                 self.state = "completed"
                 self.stop_event.set()
-                self.logger.info(f"Process killed successfully: pid={self.pid}")
+                self.logger.info("Process killed successfully: pid=%s", self.pid)
 
                 return "success"
 
         except Exception as e:
-            self.logger.error(f"Error killing process: pid={self.pid}, error={str(e)}", exc_info=True)
+            self.logger.error("Error killing process: pid=%s, error=%s", self.pid, e, exc_info=True)
             return f"failed: {str(e)}"
 
     def cleanup(self) -> None:
         """Clean up resources used by the process handler."""
-        self.logger.info(f"Cleaning up resources: pid={self.pid}")
+        self.logger.info("Cleaning up resources: pid=%s", self.pid)
         with self.lock:
             if self.process and self.process.poll() is None:
                 try:
-                    self.logger.debug(f"Killing process during cleanup: pid={self.pid}")
+                    self.logger.debug("Killing process during cleanup: pid=%s", self.pid)
                     self.process.kill()
                 except Exception as e:
-                    self.logger.error(f"Error killing process during cleanup: pid={self.pid}, error={str(e)}")
+                    self.logger.error("Error killing process during cleanup: pid=%s, error=%s", self.pid, e)
 
             self.stop_event.set()
-            self.logger.debug("Stop event set for reader threads")
 
-            # Close pipes if they exist
-            if self.process:
-                if self.process.stdin:
+            # Stop reading output; the reactor closes the pipes once it has let go of them
+            self.logger.debug("Removing output streams from the reactor")
+            for stream in self._streams:
+                stream.close()
+            pidfd = self._pidfd
+            if pidfd is not None:
+                get_reactor().remove_reader(pidfd, self._check_exit, self._close_pidfd)
+
+            process = self.process
+
+        # Close stdin once no write is in progress
+        if process:
+            with self._stdin_lock:
+                self._stdin_fd = None
+                if process.stdin:
                     try:
                         self.logger.debug("Closing stdin pipe")
-                        self.process.stdin.close()
+                        process.stdin.close()
                     except Exception as e:
-                        self.logger.error(f"Error closing stdin: {str(e)}")
+                        self.logger.error("Error closing stdin: %s", e)
 
     def get_output_lines(self, max_lines: int = 5, timeout: float = 15.0) -> List[str]:
         """
@@ -365,11 +527,38 @@ class ProcessHandler:
         Returns:
             List of recent output lines
         """
-        self.logger.debug(f"Getting output lines: pid={self.pid}, max_lines={max_lines}")
-        with self.lock:
-            lines = self.buffer.get_lines(max_lines)
-            self.logger.debug(f"Retrieved {len(lines)} output lines")
-            return lines
+        self.logger.debug("Getting output lines: pid=%s, max_lines=%s", self.pid, max_lines)
+        lines = self.buffer.get_lines(max_lines)
+        self.logger.debug("Retrieved %d output lines", len(lines))
+        return lines
+
+    @staticmethod
+    def compile_search(search_type: str, pattern: str) -> Tuple[Optional[Union[str, Pattern]], Optional[str]]:
+        """
+        Prepare a search pattern once so it can be reused for many searches.
+
+        Regex and wildcard patterns are compiled (and cached across calls);
+        string patterns are used as they are.
+
+        Args:
+            search_type: Type of search ("string", "regex", or "wildcard")
+            pattern: Pattern to search for
+
+        Returns:
+            Tuple of (matcher, error) where matcher is the value to pass to
+            search_output_compiled() and error is None, or matcher is None
+            and error describes why the pattern cannot be used
+        """
+        if search_type == "string":
+            return pattern, None
+        if search_type == "regex":
+            return cached_regex(pattern)
+        if search_type == "wildcard":
+            if not pattern:
+                # Let the buffer report the empty pattern
+                return pattern, None
+            return cached_regex(fnmatch.translate(pattern))
+        return None, f"Invalid search type: {search_type}. Must be 'string', 'regex', or 'wildcard'"
 
     def search_output(self,
                       search_type: str,
@@ -389,108 +578,182 @@ class ProcessHandler:
         Returns:
             List of matching lines or error message
         """
-        self.logger.debug(f"Searching output: pid={self.pid}, search_type={search_type}, pattern={self._truncate_for_logging(pattern)}, max_lines={max_lines}")
-        with self.lock:
-            try:
-                if search_type == "string":
-                    matches = self.buffer.search_string(pattern, max_lines)
-                elif search_type == "regex":
-                    matches = self.buffer.search_regex(pattern, max_lines)
-                elif search_type == "wildcard":
-                    matches = self.buffer.search_wildcard(pattern, max_lines)
-                else:
-                    error_msg = f"Invalid search type: {search_type}. Must be 'string', 'regex', or 'wildcard'"
-                    self.logger.warning(error_msg)
-                    return [f"ERROR: {error_msg}"]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Searching output: pid=%s, search_type=%s, pattern=%s, max_lines=%s",
+                              self.pid, search_type, self._truncate_for_logging(pattern), max_lines)
+        try:
+            matcher, error_msg = self.compile_search(search_type, pattern)
+        except Exception as e:
+            error_msg = f"Unexpected error during search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
+        if error_msg:
+            self.logger.warning(error_msg)
+            return [f"ERROR: {error_msg}"]
+
+        return self.search_output_compiled(search_type, matcher, max_lines, timeout=timeout)
+
+    def search_output_compiled(self,
+                               search_type: str,
+                               matcher: Union[str, Pattern],
+                               max_lines: int = 5,
+                               timeout: float = 15.0) -> List[str]:
+        """
+        Search process output with a pattern prepared by compile_search().
+
+        Args:
+            search_type: Type of search ("string", "regex", or "wildcard")
+            matcher: Matcher returned by compile_search() for the same search type
+            max_lines: Maximum number of matching lines to return (default: 5)
+                      Use 0 to get all matching lines.
+            timeout: Maximum time to wait (seconds)
 
-                # Check if the search method returned an error
-                if matches and isinstance(matches[0], str) and matches[0].startswith("ERROR:"):
-                    self.logger.warning(f"Search error: {matches[0]}")
-                    return matches
+        Returns:
+            List of matching lines or error message
+        """
+        try:
+            if search_type == "string":
+                matches = self.buffer.search_string(matcher, max_lines)
+            elif search_type == "regex":
+                matches = self.buffer.search_regex(matcher, max_lines)
+            elif search_type == "wildcard":
+                matches = self.buffer.search_wildcard(matcher, max_lines)
+            else:
+                error_msg = f"Invalid search type: {search_type}. Must be 'string', 'regex', or 'wildcard'"
+                self.logger.warning(error_msg)
+                return [f"ERROR: {error_msg}"]
 
-                self.logger.debug(f"Search found {len(matches)} matching lines")
+            # Check if the search method returned an error
+            if matches and isinstance(matches[0], str) and matches[0].startswith("ERROR:"):
+                self.logger.warning("Search error: %s", matches[0])
                 return matches
-            except Exception as e:
-                error_msg = f"Unexpected error during search: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                return [f"ERROR: {error_msg}"]
 
-    def send_line(self, line: str, timeout: float = 15.0) -> str:
+            self.logger.debug("Search found %d matching lines", len(matches))
+            return matches
+        except Exception as e:
+            error_msg = f"Unexpected error during search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
+
+    def _check_writable(self) -> Optional[str]:
+        """
+        Check that the process is running and can accept input.
+
+        Returns:
+            None if input can be sent, otherwise "failed: {error}"
+        """
+        with self.lock:
+            if not self.process:
+                self.logger.warning("No process running")
+                return "failed: No process running"
+
+            if self.state != "running":
+                self.logger.warning("Process not in running state: state=%s", self.state)
+                return "failed: Process not in running state"
+
+        return None
+
+    def _encode_input(self, data: Union[str, bytes, bytearray, memoryview]) -> Union[bytes, bytearray, memoryview]:
+        """
+        Convert input for the process stdin to bytes.
+
+        Binary input is passed through without copying; strings are encoded as UTF-8.
+
+        Args:
+            data: Text or binary data to send
+
+        Returns:
+            Bytes-like object to write
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        return data.encode('utf-8')
+
+    def send_line(self, line: Union[str, bytes], timeout: float = 15.0) -> str:
         """
         Send a line of text to the process stdin.
 
         Args:
-            line: Line of text to send
+            line: Line of text to send. Bytes are sent as-is without re-encoding.
             timeout: Maximum time to wait (seconds)
 
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Sending line to process: pid={self.pid}, line={self._truncate_for_logging(line)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sending line to process: pid=%s, line=%s", self.pid, self._truncate_for_logging(line))
         try:
-            with self.lock:
-                if not self.process:
-                    self.logger.warning("No process running")
-                    return "failed: No process running"
-
-                if self.state != "running":
-                    self.logger.warning(f"Process not in running state: state={self.state}")
-                    return "failed: Process not in running state"
-
-                if not self.process.stdin:
+            error = self._check_writable()
+            if error:
+                return error
+
+            # Write to stdin, adding a newline if not present. The payload
+            # and the newline go out in one writev() without concatenating.
+            payload = self._encode_input(line)
+            buffers = (payload,) if payload[-1:] == b'\n' else (payload, b'\n')
+            with self._stdin_lock:
+                if self._stdin_fd is None:
                     self.logger.warning("Process stdin not available")
                     return "failed: Process stdin not available"
 
-                # Add newline if not present
-                if not line.endswith('\n'):
-                    line += '\n'
-
-                # Write to stdin
                 self.logger.debug("Writing to process stdin")
-                self.process.stdin.write(line.encode('utf-8'))
-                self.process.stdin.flush()
+                self._write_all(self._stdin_fd, buffers)
                 self.logger.debug("Successfully wrote to stdin")
 
-                return "success"
+            return "success"
 
         except Exception as e:
-            self.logger.error(f"Error sending line to process: pid={self.pid}, error={str(e)}", exc_info=True)
+            self.logger.error("Error sending line to process: pid=%s, error=%s", self.pid, e, exc_info=True)
             return f"failed: {str(e)}"
 
-    def send_chars(self, chars: str, timeout: float = 15.0) -> str:
+    def _write_all(self, fd: int, buffers: Tuple[bytes, ...]) -> None:
+        """
+        Write a sequence of buffers to a file descriptor with as few syscalls as possible.
+
+        Args:
+            fd: File descriptor to write to
+            buffers: Buffers to write, in order
+        """
+        views = [memoryview(buf) for buf in buffers if buf]
+        while views:
+            written = os.writev(fd, views)
+            # Drop fully written buffers and resume a short write mid-buffer
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if written:
+                views[0] = views[0][written:]
+
+    def send_chars(self, chars: Union[str, bytes], timeout: float = 15.0) -> str:
         """
         Send raw characters to the process stdin.
 
         Args:
-            chars: Characters to send
+            chars: Characters to send. Bytes are sent as-is without re-encoding.
             timeout: Maximum time to wait (seconds)
 
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Sending chars to process: pid={self.pid}, chars={self._truncate_for_logging(chars)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sending chars to process: pid=%s, chars=%s", self.pid, self._truncate_for_logging(chars))
         try:
-            with self.lock:
-                if not self.process:
-                    self.logger.warning("No process running")
-                    return "failed: No process running"
-
-                if self.state != "running":
-                    self.logger.warning(f"Process not in running state: state={self.state}")
-                    return "failed: Process not in running state"
-
-                if not self.process.stdin:
+            error = self._check_writable()
+            if error:
+                return error
+
+            # Write straight to the stdin descriptor
+            payload = self._encode_input(chars)
+            with self._stdin_lock:
+                if self._stdin_fd is None:
                     self.logger.warning("Process stdin not available")
                     return "failed: Process stdin not available"
 
-                # Write to stdin
                 self.logger.debug("Writing raw chars to process stdin")
-                self.process.stdin.write(chars.encode('utf-8'))
-                self.process.stdin.flush()
+                self._write_all(self._stdin_fd, (payload,))
                 self.logger.debug("Successfully wrote chars to stdin")
 
-                return "success"
+            return "success"
 
         except Exception as e:
-            self.logger.error(f"Error sending chars to process: pid={self.pid}, error={str(e)}", exc_info=True)
+            self.logger.error("Error sending chars to process: pid=%s, error=%s", self.pid, e, exc_info=True)
             return f"failed: {str(e)}"
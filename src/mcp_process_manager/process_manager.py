@@ -5,14 +5,117 @@ This module provides the ProcessManager class which serves as the main interface
 for launching, monitoring, and interacting with multiple processes.
 """
 
+import atexit
+import concurrent.futures
+import io
+import queue
 import threading
 import logging
+import logging.handlers
 import os
-from typing import List, Dict, Tuple, Optional, Any
+import time
+from typing import List, Dict, Tuple, Optional, Any, Union
 from datetime import datetime
 
 from .process_handler import ProcessHandler
 
+logger = logging.getLogger("mcp_process_manager")
+
+# Directory the log files are written to
+LOG_DIR = "./logs"
+
+# Size of the write buffer in front of the log file
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Maximum number of seconds a written log record stays in the buffer
+LOG_FLUSH_INTERVAL = 0.5
+
+# Search types accepted by stdio_search_lines and all_search
+_VALID_SEARCH_TYPES = frozenset(("string", "regex", "wildcard"))
+
+# Writes queued log records to the log file on a background thread. Shared by
+# every ProcessManager, since they all log through the same package logger.
+_log_listener = None
+_log_setup_lock = threading.Lock()
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that buffers writes instead of flushing every record.
+
+    The buffer is flushed by _FlushingQueueListener, when the file is rotated
+    and when the handler is closed.
+    """
+
+    def _open(self):
+        """Open the log file with a LOG_BUFFER_SIZE write buffer. Also used after each rotation."""
+        # Text goes straight through to the binary buffer so that its tell() is exact
+        buffered = open(self.baseFilename, self.mode + "b", buffering=LOG_BUFFER_SIZE)
+        return io.TextIOWrapper(buffered, encoding=self.encoding, errors=self.errors, write_through=True)
+
+    def shouldRollover(self, record):
+        """Check the file size without flushing, which TextIOWrapper.tell() would do."""
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            pos = self.stream.buffer.tell()
+            if pos and pos + len(self.format(record)) + 1 >= self.maxBytes:
+                return True
+        return False
+
+    def flush(self):
+        """Skip the flush StreamHandler.emit() does after every record."""
+
+    def flush_buffer(self):
+        """Write buffered records to the log file."""
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that flushes buffered handlers at most LOG_FLUSH_INTERVAL seconds after a write.
+
+    Flushing happens on the listener thread itself, so no extra timer thread is needed.
+    """
+
+    def __init__(self, log_queue, *handlers, respect_handler_level=False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._flush_deadline = None  # Set while records are waiting in a buffer
+
+    def _flush_handlers(self):
+        """Flush every handler that buffers its output."""
+        for handler in self.handlers:
+            if isinstance(handler, _BufferedRotatingFileHandler):
+                handler.flush_buffer()
+        self._flush_deadline = None
+
+    def dequeue(self, block):
+        """Get the next record, flushing buffered handlers when their deadline passes."""
+        while True:
+            timeout = None
+            if self._flush_deadline is not None:
+                timeout = max(0.0, self._flush_deadline - time.monotonic())
+            try:
+                record = self.queue.get(block, timeout)
+            except queue.Empty:
+                if not block:
+                    raise
+                self._flush_handlers()
+                continue
+
+            # The record is about to be written, so make sure a flush is due for it
+            now = time.monotonic()
+            if self._flush_deadline is not None and now >= self._flush_deadline:
+                self._flush_handlers()
+            if self._flush_deadline is None:
+                self._flush_deadline = now + LOG_FLUSH_INTERVAL
+            return record
+
 
 class ProcessManager:
     """
@@ -24,14 +127,25 @@ class ProcessManager:
     Example usage:
         manager = ProcessManager()
         status, pid = manager.process_start(["ls", "-la"])
-        if "success" in status:
+        if status == "success":
             lines = manager.stdio_get_lines(pid)
     """
 
     def __init__(self):
         """Initialize a new process manager."""
-        self.processes = {}  # pid -> ProcessHandler
-        self.lock = threading.RLock()
+        # pid -> ProcessHandler. The dict is never modified in place: writers
+        # build a copy under _write_lock and publish it by rebinding the
+        # attribute, so readers can load it once and use it without locking.
+        self.processes = {}
+        self._write_lock = threading.Lock()
+
+        # pid -> (handler, output version, search type, pattern, max lines, matches)
+        # for the last all_search of each process, reused while its output is unchanged
+        self._search_cache = {}
+
+        # Runs blocking per-process calls of the all_* operations concurrently.
+        # Worker threads are only started when work is submitted.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="mcp-procman")
 
         # Set up logging
         self._setup_logging()
@@ -39,54 +153,88 @@ class ProcessManager:
 
     def _setup_logging(self):
         """Set up logging configuration."""
-        # Create logs directory if it doesn't exist
-        log_dir = "./logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        global _log_listener
 
         # Configure logger
-        self.logger = logging.getLogger("mcp_process_manager")
+        self.logger = logger
         self.logger.setLevel(logging.INFO)
 
-        # Create file handler with daily rotation
-        today = datetime.now().strftime("%Y_%m_%d")
-        log_file = f"{log_dir}/mcp_procman_{today}.log"
+        # Handlers are attached to the shared package logger only once; the
+        # lock stops concurrently constructed managers from both adding them
+        with _log_setup_lock:
+            if self.logger.handlers:
+                return
 
-        # Check if handlers already exist to avoid duplicates
-        if not self.logger.handlers:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.INFO)
+            # Create logs directory if it doesn't exist
+            os.makedirs(LOG_DIR, exist_ok=True)
+
+            # Create file handler with daily rotation
+            today = datetime.now().strftime("%Y_%m_%d")
+            log_file = f"{LOG_DIR}/mcp_procman_{today}.log"
 
             # Create formatter
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
 
-            # Add handler to logger
-            self.logger.addHandler(file_handler)
-
-            # Configure log rotation
+            # Configure log rotation, falling back to a plain file handler
+            setup_error = None
             try:
-                from logging.handlers import RotatingFileHandler
-                # Replace the file handler with a rotating one
-                self.logger.removeHandler(file_handler)
-                rotating_handler = RotatingFileHandler(
+                file_handler = _BufferedRotatingFileHandler(
                     log_file,
                     maxBytes=10 * 1024 * 1024,  # 10MB
                     backupCount=5
                 )
-                rotating_handler.setFormatter(formatter)
-                self.logger.addHandler(rotating_handler)
             except Exception as e:
-                self.logger.error(f"Failed to set up log rotation: {str(e)}")
+                setup_error = e
+                file_handler = logging.FileHandler(log_file)
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(formatter)
+
+            # Logging calls only enqueue the record; the listener thread
+            # formats it and does the file I/O
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _log_listener = _FlushingQueueListener(log_queue, file_handler, respect_handler_level=True)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+
+        if setup_error is not None:
+            self.logger.error("Failed to set up log rotation: %s", setup_error)
 
     def _truncate_for_logging(self, value, max_length=50):
         """Truncate a value for logging purposes."""
-        if isinstance(value, str) and len(value) > max_length:
-            return value[:max_length - 3] + "..."
-        elif isinstance(value, list):
-            return [self._truncate_for_logging(item) for item in value[:5]] + (["..."] if len(value) > 5 else [])
+        # Exact type checks are enough for API arguments and skip the isinstance() MRO walk
+        value_type = type(value)
+        if value_type is str or value_type is bytes:
+            if len(value) <= max_length:
+                return value
+            return value[:max_length - 3] + ("..." if value_type is str else b"...")
+        if value_type is list:
+            # Only rebuild the list if something in it needs truncating
+            if len(value) <= 5 and all(type(item) is str and len(item) <= max_length for item in value):
+                return value
+            return [self._truncate_for_logging(item, max_length) for item in value[:5]] + (["..."] if len(value) > 5 else [])
         return value
 
+    def _validate_search(self, search_type: str, pattern: str) -> Optional[str]:
+        """
+        Check the search type and pattern of a search request.
+
+        Args:
+            search_type: Type of search ("string", "regex", or "wildcard")
+            pattern: Pattern to search for
+
+        Returns:
+            None if the request is valid, otherwise an error message
+        """
+        if search_type not in _VALID_SEARCH_TYPES:
+            error_msg = f"Invalid search type: {search_type}. Must be 'string', 'regex', or 'wildcard'"
+        elif pattern is None or (isinstance(pattern, str) and not pattern):
+            error_msg = "Search pattern cannot be empty"
+        else:
+            return None
+        self.logger.warning(error_msg)
+        return error_msg
+
     def process_start(self, command: List[str], timeout: float = 15.0) -> Tuple[str, Optional[int]]:
         """
         Start a new process.
@@ -99,16 +247,22 @@ class ProcessManager:
             Tuple of (status, pid) where status is "success" or "failed: {error}"
             and pid is the process ID or None if failed
         """
-        self.logger.info(f"Starting process: command={self._truncate_for_logging(command)}, timeout={timeout}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Starting process: command=%s, timeout=%s", self._truncate_for_logging(command), timeout)
 
-        # Validate command
-        if not command:
-            error_msg = "Command list cannot be empty"
+        # Validate command. Any iterable of arguments is accepted, except a
+        # bare string, which would otherwise be split into characters.
+        try:
+            if isinstance(command, (str, bytes)):
+                raise TypeError
+            command = list(command)
+        except TypeError:
+            error_msg = f"Command must be a list, got {type(command).__name__}"
             self.logger.error(error_msg)
             return f"failed: {error_msg}", None
 
-        if not isinstance(command, list):
-            error_msg = f"Command must be a list, got {type(command).__name__}"
+        if not command:
+            error_msg = "Command list cannot be empty"
             self.logger.error(error_msg)
             return f"failed: {error_msg}", None
 
@@ -116,12 +270,14 @@ class ProcessManager:
             handler = ProcessHandler(command)
             status, pid = handler.start(timeout=timeout)
 
-            if "success" in status and pid is not None:
-                with self.lock:
-                    self.processes[pid] = handler
-                    self.logger.info(f"Process started successfully: pid={pid}")
+            if status == "success" and pid is not None:
+                with self._write_lock:
+                    processes = dict(self.processes)
+                    processes[pid] = handler
+                    self.processes = processes
+                self.logger.info("Process started successfully: pid=%s", pid)
             else:
-                self.logger.error(f"Failed to start process: status={status}")
+                self.logger.error("Failed to start process: status=%s", status)
 
             return status, pid
 
@@ -141,21 +297,20 @@ class ProcessManager:
         Returns:
             Dictionary with process status information
         """
-        self.logger.info(f"Getting status for process: pid={pid}, timeout={timeout}")
-
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                self.logger.warning(f"Process not found: pid={pid}")
-                return {
-                    "command": [],
-                    "state": "error: Process not found",
-                    "last_five_lines": ""
-                }
+        self.logger.info("Getting status for process: pid=%s, timeout=%s", pid, timeout)
 
-            status = handler.get_status(timeout=timeout)
-            self.logger.info(f"Process status: pid={pid}, state={status['state']}")
-            return status
+        handler = self.processes.get(pid)
+        if handler is None:
+            self.logger.warning("Process not found: pid=%s", pid)
+            return {
+                "command": [],
+                "state": "error: Process not found",
+                "last_five_lines": ""
+            }
+
+        status = handler.get_status(timeout=timeout)
+        self.logger.info("Process status: pid=%s, state=%s", pid, status['state'])
+        return status
 
     def process_kill(self, pid: int, timeout: float = 15.0) -> str:
         """
@@ -168,21 +323,20 @@ class ProcessManager:
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Killing process: pid={pid}, timeout={timeout}")
+        self.logger.info("Killing process: pid=%s, timeout=%s", pid, timeout)
 
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                self.logger.warning(f"Process not found for kill: pid={pid}")
-                return "failed: Process not found"
+        handler = self.processes.get(pid)
+        if handler is None:
+            self.logger.warning("Process not found for kill: pid=%s", pid)
+            return "failed: Process not found"
 
-            result = handler.kill(timeout=timeout)
-            if "success" in result:
-                self.logger.info(f"Process killed successfully: pid={pid}")
-            else:
-                self.logger.error(f"Failed to kill process: pid={pid}, result={result}")
+        result = handler.kill(timeout=timeout)
+        if result == "success":
+            self.logger.info("Process killed successfully: pid=%s", pid)
+        else:
+            self.logger.error("Failed to kill process: pid=%s, result=%s", pid, result)
 
-            return result
+        return result
 
     def process_remove(self, pid: int, timeout: float = 15.0) -> str:
         """
@@ -195,31 +349,34 @@ class ProcessManager:
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Removing process: pid={pid}, timeout={timeout}")
-
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                self.logger.warning(f"Process not found for removal: pid={pid}")
+        self.logger.info("Removing process: pid=%s, timeout=%s", pid, timeout)
+
+        # Remove from tracking first, so no other call can reach the handler
+        # while it is being killed and cleaned up outside the lock
+        with self._write_lock:
+            processes = dict(self.processes)
+            handler = processes.pop(pid, None)
+            if handler is None:
+                self.logger.warning("Process not found for removal: pid=%s", pid)
                 return "failed: Process not found"
+            self.processes = processes
+        self._search_cache.pop(pid, None)
+        self.logger.info("Process removed from tracking: pid=%s", pid)
 
-            # Kill process if still running
-            if handler.state == "running":
-                kill_result = handler.kill(timeout=timeout)
-                self.logger.info(f"Kill result during removal: pid={pid}, result={kill_result}")
-
-            # Clean up resources
-            try:
-                handler.cleanup()
-                self.logger.info(f"Process resources cleaned up: pid={pid}")
-            except Exception as e:
-                self.logger.error(f"Error during cleanup: pid={pid}, error={str(e)}")
+        # Kill process if still running
+        state = handler.state
+        if state == "running":
+            kill_result = handler.kill(timeout=timeout)
+            self.logger.info("Kill result during removal: pid=%s, result=%s", pid, kill_result)
 
-            # Remove from tracking
-            del self.processes[pid]
-            self.logger.info(f"Process removed from tracking: pid={pid}")
+        # Clean up resources
+        try:
+            handler.cleanup()
+            self.logger.info("Process resources cleaned up: pid=%s", pid)
+        except Exception as e:
+            self.logger.error("Error during cleanup: pid=%s, error=%s", pid, e)
 
-            return "success"
+        return "success"
 
     def process_list(self, timeout: float = 15.0) -> List[Tuple[int, List[str], str]]:
         """
@@ -231,16 +388,15 @@ class ProcessManager:
         Returns:
             List of tuples (pid, command, state)
         """
-        self.logger.info(f"Listing all processes: timeout={timeout}")
+        self.logger.info("Listing all processes: timeout=%s", timeout)
 
         result = []
 
-        with self.lock:
-            for pid, handler in self.processes.items():
-                status = handler.get_status(timeout=timeout)
-                result.append((pid, status["command"], status["state"]))
+        for pid, handler in self.processes.items():
+            status = handler.get_status(timeout=timeout)
+            result.append((pid, status["command"], status["state"]))
 
-        self.logger.info(f"Process list result: count={len(result)}")
+        self.logger.info("Process list result: count=%s", len(result))
         return result
 
     def all_kill(self, timeout: float = 15.0) -> str:
@@ -253,32 +409,69 @@ class ProcessManager:
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Killing all running processes: timeout={timeout}")
+        self.logger.info("Killing all running processes: timeout=%s", timeout)
 
         errors = []
 
-        with self.lock:
-            process_count = len(self.processes)
-            running_count = 0
+        processes = self.processes
+        process_count = len(processes)
 
-            for pid, handler in list(self.processes.items()):
-                if handler.state == "running":
-                    running_count += 1
-                    result = handler.kill(timeout=timeout)
-                    if "failed" in result:
-                        errors.append(f"PID {pid}: {result}")
-                        self.logger.error(f"Failed to kill process: pid={pid}, error={result}")
-                    else:
-                        self.logger.info(f"Successfully killed process: pid={pid}")
+        # Kill all running processes at once, so their termination timeouts overlap
+        results = self._kill_processes(
+            [(pid, handler) for pid, handler in processes.items() if handler.state == "running"], timeout)
+        running_count = len(results)
+
+        for pid, result in results:
+            if result != "success":
+                errors.append(f"PID {pid}: {result}")
+                self.logger.error("Failed to kill process: pid=%s, error=%s", pid, result)
+            else:
+                self.logger.info("Successfully killed process: pid=%s", pid)
 
-        self.logger.info(f"All kill operation completed: total={process_count}, running={running_count}, errors={len(errors)}")
+        self.logger.info("All kill operation completed: total=%s, running=%s, errors=%s", process_count, running_count, len(errors))
 
         if errors:
             error_msg = f"failed: {'; '.join(errors)}"
-            self.logger.error(f"All kill had errors: {error_msg}")
+            self.logger.error("All kill had errors: %s", error_msg)
             return error_msg
         return "success"
 
+    def _kill_processes(self, handlers: List[Tuple[int, ProcessHandler]], timeout: float) -> List[Tuple[int, str]]:
+        """
+        Kill several processes on the worker pool, so their termination timeouts overlap.
+
+        Once shutdown() has stopped the pool, processes started afterwards
+        are killed in the calling thread instead.
+
+        Args:
+            handlers: (pid, handler) pairs of the processes to kill
+            timeout: Maximum time to wait for each process to terminate (seconds)
+
+        Returns:
+            List of (pid, "success" or "failed: {error}") pairs
+        """
+        kills = []
+        for pid, handler in handlers:
+            try:
+                future = self._pool.submit(handler.kill, timeout=timeout)
+            except RuntimeError:
+                # The pool has been shut down
+                future = concurrent.futures.Future()
+                try:
+                    future.set_result(handler.kill(timeout=timeout))
+                except Exception as e:
+                    future.set_exception(e)
+            kills.append((pid, future))
+
+        results = []
+        for pid, future in kills:
+            try:
+                result = future.result()
+            except Exception as e:
+                result = f"failed: {str(e)}"
+            results.append((pid, result))
+        return results
+
     def all_remove(self, timeout: float = 15.0) -> str:
         """
         Remove all non-running processes from tracking.
@@ -289,35 +482,81 @@ class ProcessManager:
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Removing all non-running processes: timeout={timeout}")
+        self.logger.info("Removing all non-running processes: timeout=%s", timeout)
 
         errors = []
         removed_count = 0
 
-        with self.lock:
-            for pid, handler in list(self.processes.items()):
-                if handler.state != "running":
-                    try:
-                        # Clean up resources
-                        handler.cleanup()
-
-                        # Remove from tracking
-                        del self.processes[pid]
-                        removed_count += 1
-                        self.logger.info(f"Removed non-running process: pid={pid}, state={handler.state}")
-                    except Exception as e:
-                        error_msg = str(e)
-                        errors.append(f"PID {pid}: {error_msg}")
-                        self.logger.error(f"Error removing process: pid={pid}, error={error_msg}")
+        # Remove the non-running processes from tracking in one short critical section
+        with self._write_lock:
+            processes = {}
+            removed = []
+            for pid, handler in self.processes.items():
+                # Read the state once, so the decision and the log line agree
+                state = handler.state
+                if state != "running":
+                    removed.append((pid, handler, state))
+                else:
+                    processes[pid] = handler
+            if removed:
+                self.processes = processes
+
+        # Clean up resources outside the lock
+        for pid, handler, state in removed:
+            self._search_cache.pop(pid, None)
+            try:
+                handler.cleanup()
+                removed_count += 1
+                self.logger.info("Removed non-running process: pid=%s, state=%s", pid, state)
+            except Exception as e:
+                error_msg = str(e)
+                errors.append(f"PID {pid}: {error_msg}")
+                self.logger.error("Error removing process: pid=%s, error=%s", pid, error_msg)
 
-        self.logger.info(f"All remove operation completed: removed={removed_count}, errors={len(errors)}")
+        self.logger.info("All remove operation completed: removed=%s, errors=%s", removed_count, len(errors))
 
         if errors:
             error_msg = f"failed: {'; '.join(errors)}"
-            self.logger.error(f"All remove had errors: {error_msg}")
+            self.logger.error("All remove had errors: %s", error_msg)
             return error_msg
         return "success"
 
+    def shutdown(self, timeout: float = 15.0) -> None:
+        """
+        Kill and clean up every tracked process and stop the worker pool.
+
+        All processes are removed from tracking in one step, so nothing can
+        reach them while they are torn down. The manager stays usable
+        afterwards, killing processes in the calling thread, and calling
+        this again tears down any process started since.
+
+        Args:
+            timeout: Maximum time to wait for processes to terminate (seconds)
+        """
+        self.logger.info("Shutting down process manager: timeout=%s", timeout)
+
+        with self._write_lock:
+            processes = self.processes
+            self.processes = {}
+        self._search_cache.clear()
+
+        if processes:
+            # Kill all running processes at once, then release their resources
+            results = self._kill_processes(
+                [(pid, handler) for pid, handler in processes.items() if handler.state == "running"], timeout)
+            for pid, result in results:
+                if result != "success":
+                    self.logger.error("Failed to kill process during shutdown: pid=%s, error=%s", pid, result)
+
+            for pid, handler in processes.items():
+                try:
+                    handler.cleanup()
+                except Exception as e:
+                    self.logger.error("Error during cleanup: pid=%s, error=%s", pid, e)
+
+        self._pool.shutdown(wait=False)
+        self.logger.info("Process manager shut down: processes=%s", len(processes))
+
     def all_search(self,
                    search_type: str,
                    pattern: str,
@@ -335,47 +574,60 @@ class ProcessManager:
         Returns:
             List of tuples (pid, matching_lines) or error message
         """
-        self.logger.info(f"Searching all processes: search_type={search_type}, pattern={self._truncate_for_logging(pattern)}, max_lines_per_pid={max_lines_per_pid}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Searching all processes: search_type=%s, pattern=%s, max_lines_per_pid=%s", search_type, self._truncate_for_logging(pattern), max_lines_per_pid)
 
-        # Validate search_type
-        if search_type not in ["string", "regex", "wildcard"]:
-            error_msg = f"Invalid search type: {search_type}. Must be 'string', 'regex', or 'wildcard'"
-            self.logger.warning(error_msg)
+        error_msg = self._validate_search(search_type, pattern)
+        if error_msg:
             return [(-1, [f"ERROR: {error_msg}"])]
 
-        # Validate pattern
-        if pattern is None or (isinstance(pattern, str) and not pattern):
-            error_msg = "Search pattern cannot be empty"
+        # Compile the pattern once for all processes
+        try:
+            matcher, error_msg = ProcessHandler.compile_search(search_type, pattern)
+        except Exception as e:
+            error_msg = f"Unexpected error during search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [(-1, [f"ERROR: {error_msg}"])]
+        if error_msg:
             self.logger.warning(error_msg)
             return [(-1, [f"ERROR: {error_msg}"])]
 
         result = []
         errors = []
 
-        with self.lock:
-            for pid, handler in self.processes.items():
-                try:
-                    matches = handler.search_output(search_type, pattern, max_lines_per_pid, timeout=timeout)
+        search_cache = self._search_cache
+        for pid, handler in self.processes.items():
+            try:
+                # Reuse the last result for this process if neither the
+                # search nor the output has changed since
+                version = handler.output_version
+                cached = search_cache.get(pid)
+                if cached is not None and cached[:5] == (handler, version, search_type, pattern, max_lines_per_pid):
+                    matches = list(cached[5])
+                else:
+                    matches = handler.search_output_compiled(search_type, matcher, max_lines_per_pid, timeout=timeout)
 
                     # Check if the search method returned an error
                     if matches and isinstance(matches[0], str) and matches[0].startswith("ERROR:"):
                         errors.append(f"PID {pid}: {matches[0]}")
                         continue
 
-                    if matches:
-                        result.append((pid, matches))
-                        self.logger.info(f"Found matches in process: pid={pid}, match_count={len(matches)}")
-                except Exception as e:
-                    error_msg = f"Error searching process {pid}: {str(e)}"
-                    self.logger.error(error_msg, exc_info=True)
-                    errors.append(f"PID {pid}: {error_msg}")
+                    search_cache[pid] = (handler, version, search_type, pattern, max_lines_per_pid, list(matches))
+
+                if matches:
+                    result.append((pid, matches))
+                    self.logger.info("Found matches in process: pid=%s, match_count=%s", pid, len(matches))
+            except Exception as e:
+                error_msg = f"Error searching process {pid}: {str(e)}"
+                self.logger.error(error_msg, exc_info=True)
+                errors.append(f"PID {pid}: {error_msg}")
 
         if errors:
-            self.logger.warning(f"Search completed with errors: {'; '.join(errors)}")
+            self.logger.warning("Search completed with errors: %s", '; '.join(errors))
             # Add error information to the result
             result.append((-1, [f"ERROR: {'; '.join(errors)}"]))
 
-        self.logger.info(f"Search completed: processes_with_matches={len(result)}")
+        self.logger.info("Search completed: processes_with_matches=%s", len(result))
         return result
 
     def stdio_get_lines(self, pid: int, max_lines: int = 5, timeout: float = 15.0) -> List[str]:
@@ -391,23 +643,22 @@ class ProcessManager:
         Returns:
             List of recent output lines or error message
         """
-        self.logger.info(f"Getting output lines: pid={pid}, max_lines={max_lines}, timeout={timeout}")
+        self.logger.info("Getting output lines: pid=%s, max_lines=%s, timeout=%s", pid, max_lines, timeout)
 
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                error_msg = f"Process not found: pid={pid}"
-                self.logger.warning(error_msg)
-                return [f"ERROR: {error_msg}"]
+        handler = self.processes.get(pid)
+        if handler is None:
+            error_msg = f"Process not found: pid={pid}"
+            self.logger.warning(error_msg)
+            return [f"ERROR: {error_msg}"]
 
-            try:
-                lines = handler.get_output_lines(max_lines, timeout=timeout)
-                self.logger.info(f"Got output lines: pid={pid}, line_count={len(lines)}")
-                return lines
-            except Exception as e:
-                error_msg = f"Error getting output lines: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                return [f"ERROR: {error_msg}"]
+        try:
+            lines = handler.get_output_lines(max_lines, timeout=timeout)
+            self.logger.info("Got output lines: pid=%s, line_count=%s", pid, len(lines))
+            return lines
+        except Exception as e:
+            error_msg = f"Error getting output lines: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
 
     def stdio_search_lines(self,
                           pid: int,
@@ -429,92 +680,102 @@ class ProcessManager:
         Returns:
             List of matching lines or error message
         """
-        self.logger.info(f"Searching process output: pid={pid}, search_type={search_type}, pattern={self._truncate_for_logging(pattern)}, max_lines={max_lines}")
-
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                error_msg = f"Process not found: pid={pid}"
-                self.logger.warning(error_msg)
-                return [f"ERROR: {error_msg}"]
-
-            # Validate search_type
-            if search_type not in ["string", "regex", "wildcard"]:
-                error_msg = f"Invalid search type: {search_type}. Must be 'string', 'regex', or 'wildcard'"
-                self.logger.warning(error_msg)
-                return [f"ERROR: {error_msg}"]
-
-            # Validate pattern
-            if pattern is None or (isinstance(pattern, str) and not pattern):
-                error_msg = "Search pattern cannot be empty"
-                self.logger.warning(error_msg)
-                return [f"ERROR: {error_msg}"]
-
-            matches = handler.search_output(search_type, pattern, max_lines, timeout=timeout)
-
-            # Check if the search method returned an error
-            if matches and isinstance(matches[0], str) and matches[0].startswith("ERROR:"):
-                self.logger.warning(f"Search error: {matches[0]}")
-                return matches
-
-            self.logger.info(f"Search results: pid={pid}, match_count={len(matches)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Searching process output: pid=%s, search_type=%s, pattern=%s, max_lines=%s", pid, search_type, self._truncate_for_logging(pattern), max_lines)
+
+        # Reject invalid requests before looking up the process
+        error_msg = self._validate_search(search_type, pattern)
+        if error_msg:
+            return [f"ERROR: {error_msg}"]
+
+        handler = self.processes.get(pid)
+        if handler is None:
+            error_msg = f"Process not found: pid={pid}"
+            self.logger.warning(error_msg)
+            return [f"ERROR: {error_msg}"]
+
+        matches = handler.search_output(search_type, pattern, max_lines, timeout=timeout)
+
+        # Check if the search method returned an error
+        if matches and isinstance(matches[0], str) and matches[0].startswith("ERROR:"):
+            self.logger.warning("Search error: %s", matches[0])
             return matches
 
-    def stdio_send_line(self, pid: int, line: str, timeout: float = 15.0) -> str:
+        self.logger.info("Search results: pid=%s, match_count=%s", pid, len(matches))
+        return matches
+
+    def stdio_send_line(self, pid: int, line: Union[str, bytes], timeout: float = 15.0) -> str:
         """
         Send a line of text to a process stdin.
 
         Args:
             pid: Process ID
-            line: Line of text to send
+            line: Line of text to send. Bytes are sent as-is without re-encoding.
             timeout: Maximum time to wait (seconds)
 
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Sending line to process: pid={pid}, line={self._truncate_for_logging(line)}, timeout={timeout}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sending line to process: pid=%s, line=%s, timeout=%s", pid, self._truncate_for_logging(line), timeout)
 
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                self.logger.warning(f"Process not found for sending line: pid={pid}")
-                return "failed: Process not found"
+        handler = self.processes.get(pid)
+        if handler is None:
+            self.logger.warning("Process not found for sending line: pid=%s", pid)
+            return "failed: Process not found"
 
-            result = handler.send_line(line, timeout=timeout)
-            if "success" in result:
-                self.logger.info(f"Line sent successfully: pid={pid}")
-            else:
-                self.logger.error(f"Failed to send line: pid={pid}, result={result}")
+        result = handler.send_line(line, timeout=timeout)
+        if result == "success":
+            self.logger.info("Line sent successfully: pid=%s", pid)
+        else:
+            self.logger.error("Failed to send line: pid=%s, result=%s", pid, result)
 
-            return result
+        return result
 
-    def stdio_send_chars(self, pid: int, chars: str, timeout: float = 15.0) -> str:
+    def stdio_send_chars(self, pid: int, chars: Union[str, bytes], timeout: float = 15.0) -> str:
         """
         Send raw characters to a process stdin.
 
         Args:
             pid: Process ID
-            chars: Characters to send
+            chars: Characters to send. Bytes are sent as-is without re-encoding.
             timeout: Maximum time to wait (seconds)
 
         Returns:
             "success" or "failed: {error}"
         """
-        self.logger.info(f"Sending chars to process: pid={pid}, chars={self._truncate_for_logging(chars)}, timeout={timeout}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sending chars to process: pid=%s, chars=%s, timeout=%s", pid, self._truncate_for_logging(chars), timeout)
 
-        with self.lock:
-            handler = self.processes.get(pid)
-            if not handler:
-                self.logger.warning(f"Process not found for sending chars: pid={pid}")
-                return "failed: Process not found"
+        handler = self.processes.get(pid)
+        if handler is None:
+            self.logger.warning("Process not found for sending chars: pid=%s", pid)
+            return "failed: Process not found"
+
+        result = handler.send_chars(chars, timeout=timeout)
+        if result == "success":
+            self.logger.info("Chars sent successfully: pid=%s", pid)
+        else:
+            self.logger.error("Failed to send chars: pid=%s, result=%s", pid, result)
+
+        return result
 
-            result = handler.send_chars(chars, timeout=timeout)
-            if "success" in result:
-                self.logger.info(f"Chars sent successfully: pid={pid}")
-            else:
-                self.logger.error(f"Failed to send chars: pid={pid}, result={result}")
 
-            return result
+# ProcessManager methods exposed as MCP tools by main()
+MCP_TOOLS = (
+    "process_list",
+    "process_start",
+    "process_status",
+    "process_kill",
+    "process_remove",
+    "stdio_get_lines",
+    "stdio_search_lines",
+    "stdio_send_line",
+    "stdio_send_chars",
+    "all_kill",
+    "all_remove",
+    "all_search",
+)
 
 
 def main() -> None:
@@ -522,25 +783,17 @@ def main() -> None:
     Main entry point for the MCP Process Manager when run as a command-line tool.
     This function initializes the ProcessManager and sets up FastMCP integration.
     """
+    # Bound before the try block so cleanup works even if setup fails early
+    pm: Optional[ProcessManager] = None
     try:
         from fastmcp import FastMCP
-        pm: ProcessManager = ProcessManager()
+        pm = ProcessManager()
         mcp: FastMCP = FastMCP()
 
         pm.logger.info("Adding tools to FastMCP")
 
-        mcp.add_tool(fn=pm.process_list)
-        mcp.add_tool(fn=pm.process_start)
-        mcp.add_tool(fn=pm.process_status)
-        mcp.add_tool(fn=pm.process_kill)
-        mcp.add_tool(fn=pm.process_remove)
-        mcp.add_tool(fn=pm.stdio_get_lines)
-        mcp.add_tool(fn=pm.stdio_search_lines)
-        mcp.add_tool(fn=pm.stdio_send_line)
-        mcp.add_tool(fn=pm.stdio_send_chars)
-        mcp.add_tool(fn=pm.all_kill)
-        mcp.add_tool(fn=pm.all_remove)
-        mcp.add_tool(fn=pm.all_search)
+        for name in MCP_TOOLS:
+            mcp.add_tool(fn=getattr(pm, name))
 
         # log completed adding tools
         pm.logger.info("All tools added to FastMCP")
@@ -557,24 +810,19 @@ def main() -> None:
         sys.exit(1)
     except Exception as e:
         # clean up process manager
-        pm.all_kill()
-        pm.all_remove()
-        pm.processes.clear()
+        if pm is not None:
+            pm.shutdown()
         import logging
         logging.basicConfig(level=logging.ERROR)
         logger = logging.getLogger("mcp_process_manager")
-        logger.error(f"Error in main: {str(e)}", exc_info=True)
+        logger.error("Error in main: %s", e, exc_info=True)
         print(f"Error: {str(e)}")
         import sys
         sys.exit(1)
     finally:
         # clean up process manager on weirder edge cases
-        pm.all_kill()
-        pm.all_remove()
-        pm.processes.clear()
-        del pm
-        del mcp
-        exit()
+        if pm is not None:
+            pm.shutdown()
 
 
 if __name__ == "__main__":
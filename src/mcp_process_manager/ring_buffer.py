@@ -2,15 +2,217 @@
 Ring buffer implementation for efficient storage of process output.
 
 This module provides a thread-safe ring buffer with configurable size
-that efficiently stores and retrieves process output.
+that efficiently stores and retrieves process output. Output is stored as
+raw UTF-8 bytes and only decoded when it is read back.
 """
 
 import threading
 import re
 import fnmatch
 import logging
-from collections import deque
-from typing import List, Union, Pattern
+from functools import lru_cache
+from collections import deque, OrderedDict
+from itertools import islice
+from typing import List, Union, Pattern, Iterable, Iterator, Tuple, Optional, Callable
+
+try:
+    import re2  # Optional: google-re2 matches without backtracking
+except ImportError:
+    re2 = None
+else:
+    # Patterns re2 rejects fall back to re, so its parse errors are not worth logging
+    _re2_options = re2.Options()
+    _re2_options.log_errors = False
+
+try:
+    import hyperscan  # Optional: matches many patterns in a single pass
+except ImportError:
+    hyperscan = None
+else:
+    _HS_FLAGS = (hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+                 | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+
+logger = logging.getLogger("mcp_process_manager.ring_buffer")
+
+# Number of compiled regex search patterns shared by all buffers
+REGEX_CACHE_SIZE = 256
+
+# Number of entries examined at a time when searching back from the newest entry
+SEARCH_BATCH_SIZE = 1024
+
+# Regex constructs that stop a pattern from being searched over joined lines:
+# lookarounds and \A/\Z see past the line, inline flag groups such as
+# (?-m:...) or (?s) would override the MULTILINE and line-bounded matching,
+# and atomic groups and possessive quantifiers can consume the joining
+# newline without backtracking to the line end
+_BATCH_UNSAFE = re.compile(r"\(\?[=!<>aiLmsux-]|\\[AZ]|[*+?}]\+")
+_BATCH_UNSAFE_BYTES = re.compile(_BATCH_UNSAFE.pattern.encode('ascii'))
+
+# Constructs that re2 accepts but interprets differently from re: \d, \w, \s
+# and \b are ASCII-only, [:alpha:] is a POSIX class, {,n} is not a repeat,
+# and inline flags may fold case differently. re2 matches lines without
+# their trailing newline, so constructs that could match a newline (negated
+# classes, and escapes or control characters that can form a class range
+# around it) are left to re as well.
+_RE2_UNSAFE = re.compile(r"\\[dDwWsSbBnxuUN0-7afrtv]|\[:|\[\^|\{,|\(\?[aiLmsux-]|[\x00-\x1f]")
+
+# Constructs that hyperscan, even in UTF-8 and Unicode property mode,
+# interprets differently from re: \s leaves out \x1c-\x1f, \w is matched
+# inconsistently in repeats (\w\w*k finds "\xa0k"), \Z also matches before
+# a final newline, \N is "not a newline", [:alpha:] is a POSIX class, {,n}
+# is not a repeat, and inline flags may fold case differently
+_HS_UNSAFE = re.compile(r"\\[dDwWsSbBZuUN]|\[:|\{,|\(\?[aiLmsux-]")
+
+
+def compile_regex(pattern: str) -> Pattern:
+    """
+    Compile a regex search pattern with the best available engine.
+
+    When google-re2 is installed, patterns are compiled with it, so that
+    nested repeats such as ^(a+)+$ cannot backtrack catastrophically. re2
+    is only used when it matches exactly the lines re would; patterns using
+    constructs it treats differently, or features it does not support such
+    as backreferences and lookarounds, are compiled with the standard re
+    module and keep its backtracking behaviour. Lines are searched with re2
+    without their trailing newline, which gives $ the meaning it has in re.
+
+    Args:
+        pattern: Regular expression to compile
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    # Always compile with re first, so invalid patterns get re's error messages
+    compiled = re.compile(pattern)
+    if re2 is not None and not _RE2_UNSAFE.search(pattern):
+        try:
+            return re2.compile(pattern, _re2_options)
+        except re2.error:
+            pass
+    return compiled
+
+
+def _line_search(pattern: Pattern) -> Callable:
+    """
+    Get a function that searches one stored line for a compiled pattern.
+
+    re patterns search the line as stored. re2 patterns using $ search it
+    without its trailing newline (see compile_regex()); no other construct
+    compiled with re2 can match or see the newline.
+
+    Args:
+        pattern: Compiled search pattern, from re or re2
+
+    Returns:
+        Function called with a line, returning a match or None
+    """
+    search = pattern.search
+    if isinstance(pattern, re.Pattern) or "$" not in pattern.pattern:
+        return search
+
+    def search_line(line):
+        return search(line[:-1] if line.endswith("\n") else line)
+    return search_line
+
+
+# Most recently used regex patterns: pattern string -> (compiled, error)
+_regex_cache = OrderedDict()
+_regex_cache_lock = threading.Lock()
+
+
+def cached_regex(pattern: str) -> Tuple[Optional[Pattern], Optional[str]]:
+    """
+    Compile a regex search pattern, reusing the result for repeated searches.
+
+    The cache is shared by every buffer, since clients tend to poll many
+    processes with the same patterns. Invalid patterns are remembered too,
+    so polling with the same bad pattern does not re-run the compiler
+    every time.
+
+    Args:
+        pattern: Regular expression to compile
+
+    Returns:
+        Tuple of (compiled pattern, None), or (None, error message)
+    """
+    with _regex_cache_lock:
+        result = _regex_cache.get(pattern)
+        if result is not None:
+            _regex_cache.move_to_end(pattern)
+            return result
+
+    # Compile outside the lock so other searches are not held up
+    try:
+        result = (compile_regex(pattern), None)
+    except re.error as e:
+        result = (None, f"Invalid regex pattern: {str(e)}")
+
+    with _regex_cache_lock:
+        _regex_cache[pattern] = result
+        if len(_regex_cache) > REGEX_CACHE_SIZE:
+            _regex_cache.popitem(last=False)
+    return result
+
+
+@lru_cache(maxsize=32)
+def _multi_database(patterns: Tuple[bytes, ...]) -> Optional[tuple]:
+    """
+    Compile a hyperscan database that matches any of several patterns.
+
+    Patterns are compiled in UTF-8 and Unicode property mode, so that . and
+    character classes see code points as re does, and are allowed to match
+    the empty string.
+
+    Args:
+        patterns: UTF-8 encoded regular expressions
+
+    Returns:
+        Tuple of (database, lock serializing scans with its scratch space),
+        or None if hyperscan cannot compile the patterns
+    """
+    database = hyperscan.Database()
+    try:
+        database.compile(expressions=list(patterns),
+                         ids=list(range(len(patterns))),
+                         elements=len(patterns),
+                         flags=[_HS_FLAGS] * len(patterns))
+    except hyperscan.error as e:
+        logger.debug("hyperscan cannot compile patterns, using re instead: %s", e)
+        return None
+    return database, threading.Lock()
+
+
+@lru_cache(maxsize=128)
+def _batch_pattern(pattern: Pattern) -> Optional[Pattern]:
+    """
+    Derive a pattern for testing many lines joined with newlines at once.
+
+    The derived pattern matches the joined text whenever the original
+    matches any one of the lines; it may also match when none does, so it
+    can only rule batches out. With MULTILINE, ^ and $ still match at each
+    line's start and end. Lookarounds, \\A, \\Z, inline flags, atomic
+    groups and possessive quantifiers cannot be carried over, so patterns
+    using them get None.
+
+    Args:
+        pattern: Compiled search pattern, from re or re2
+
+    Returns:
+        Pattern to search the joined lines with, or None
+    """
+    source = pattern.pattern
+    unsafe = _BATCH_UNSAFE_BYTES if isinstance(source, bytes) else _BATCH_UNSAFE
+    if unsafe.search(source):
+        return None
+    if isinstance(pattern, re.Pattern):
+        return re.compile(source, pattern.flags | re.MULTILINE)
+    try:
+        return re2.compile("(?m)" + source, _re2_options)
+    except re2.error:
+        return None
 
 
 class RingBuffer:
@@ -21,6 +223,9 @@ class RingBuffer:
     when the buffer is full. It provides methods for adding data, retrieving
     recent lines, and searching through the buffer contents.
 
+    Entries are kept as bytes so that writers never pay for decoding; lines
+    are decoded as UTF-8 (replacing invalid sequences) only when returned.
+
     Example usage:
         buffer = RingBuffer(max_size_bytes=1024 * 1024)  # 1MB buffer
         buffer.append("Line 1\n")
@@ -28,6 +233,9 @@ class RingBuffer:
         lines = buffer.get_lines(2)  # Get last 2 lines
     """
 
+    # Every process keeps a buffer, and append() runs for each line of output
+    __slots__ = ("max_size_bytes", "buffer", "current_size", "version", "lock", "logger")
+
     def __init__(self, max_size_bytes: int = 10 * 1024 * 1024):
         """
         Initialize a new ring buffer with the specified maximum size.
@@ -38,50 +246,222 @@ class RingBuffer:
         self.max_size_bytes = max_size_bytes
         self.buffer = deque()
         self.current_size = 0
-        self.lock = threading.RLock()
+        self.version = 0  # Incremented on every change to the contents
+        # Never held across a call to another locking method, so it need not be re-entrant
+        self.lock = threading.Lock()
 
         # Set up logger
-        self.logger = logging.getLogger("mcp_process_manager.ring_buffer")
-        self.logger.info(f"RingBuffer initialized: max_size_bytes={max_size_bytes}")
+        self.logger = logger
+        self.logger.debug("RingBuffer initialized: max_size_bytes=%s", max_size_bytes)
 
     def _truncate_for_logging(self, value, max_length=50):
         """Truncate a value for logging purposes."""
-        if isinstance(value, str) and len(value) > max_length:
-            return value[:max_length - 3] + "..."
+        if isinstance(value, (str, bytes)) and len(value) > max_length:
+            return value[:max_length - 3] + ("..." if isinstance(value, str) else b"...")
         return value
 
-    def append(self, data: str) -> None:
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """Decode a stored entry, replacing invalid UTF-8 sequences."""
+        return data.decode('utf-8', errors='replace')
+
+    def _decode_all(self, entries: Iterable[bytes]) -> List[str]:
+        """
+        Decode a sequence of stored entries.
+
+        Process output is almost always valid UTF-8, so all entries are first
+        decoded strictly in one map() call, which avoids the per-line error
+        handler lookup. Only if that fails are they decoded one by one with
+        invalid sequences replaced.
+        """
+        if not isinstance(entries, (list, tuple)):
+            entries = list(entries)
+        try:
+            return list(map(bytes.decode, entries))
+        except UnicodeDecodeError:
+            return [self._decode(entry) for entry in entries]
+
+    @staticmethod
+    def _to_bytes(data: Union[str, bytes]) -> bytes:
+        """Convert data to the bytes form in which it is stored."""
+        if isinstance(data, str):
+            return data.encode('utf-8')
+        return bytes(data)
+
+    def _truncate(self, data: bytes) -> bytes:
+        """
+        Cut an entry larger than the whole buffer down to its last max_size_bytes.
+
+        Args:
+            data: Entry to store
+
+        Returns:
+            The entry, truncated if necessary
+        """
+        if len(data) > self.max_size_bytes:
+            self.logger.warning("Data size (%s bytes) exceeds buffer size, truncating", len(data))
+            return data[-self.max_size_bytes:]
+        return data
+
+    def _add(self, data: bytes) -> int:
+        """
+        Store one entry, removing oldest entries if necessary. Call with self.lock held.
+
+        Args:
+            data: Entry to store, no larger than the buffer
+
+        Returns:
+            Number of old entries removed to make space
+        """
+        max_size = self.max_size_bytes
+
+        # Remove oldest entries until we have space, keeping the running size
+        # in a local and storing it back once
+        buffer = self.buffer
+        new_size = self.current_size + len(data)
+        removed_count = 0
+        while new_size > max_size and buffer:
+            new_size -= len(buffer.popleft())
+            removed_count += 1
+
+        # Add new data
+        buffer.append(data)
+        self.current_size = new_size
+        self.version += 1
+        return removed_count
+
+    def _snapshot(self) -> tuple:
+        """
+        Copy the current entries so they can be scanned without holding the lock.
+
+        Returns:
+            Tuple of the stored entries, oldest first
+        """
+        with self.lock:
+            return tuple(self.buffer)
+
+    def _find(self, predicate: Callable, max_lines: int, decoded: bool,
+              batch_test: Optional[Callable] = None) -> List[str]:
+        """
+        Find the stored entries accepted by a predicate.
+
+        Entries are examined in batches starting from the newest, so when
+        only the last max_lines matches are wanted the scan stops as soon as
+        enough matches have been found.
+
+        Args:
+            predicate: Function called with each entry
+            max_lines: Maximum number of matches to return, or 0 for all
+            decoded: Whether predicate expects decoded lines rather than raw bytes
+            batch_test: Optional function called with each batch of entries,
+                        in the form predicate expects, returning False if
+                        none of them can match so the batch is skipped
+                        without testing each entry
+
+        Returns:
+            List of matching lines, oldest first
+        """
+        entries = self._snapshot()
+
+        parts = []
+        count = 0
+        end = len(entries)
+        while end > 0 and (max_lines <= 0 or count < max_lines):
+            start = max(0, end - SEARCH_BATCH_SIZE)
+            batch = entries[start:end]
+            end = start
+            if decoded:
+                batch = self._decode_all(batch)
+            if batch_test is not None and not batch_test(batch):
+                continue
+            # filter() keeps the loop in C when predicate is a builtin like Pattern.search
+            found = list(filter(predicate, batch))
+            if max_lines > 0:
+                found = found[-(max_lines - count):]
+            parts.append(found)
+            count += len(found)
+
+        # Newer batches were searched first, so put them back in order
+        matches = [line for found in reversed(parts) for line in found]
+        return matches if decoded else self._decode_all(matches)
+
+    def append(self, data: Union[str, bytes]) -> None:
         """
         Add data to the buffer, removing oldest entries if necessary.
 
         Args:
-            data: String data to add to the buffer
+            data: Data to add to the buffer, either raw UTF-8 bytes or a
+                  string (which is encoded before it is stored)
         """
+        data = self._to_bytes(data)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Appending data: size=%s bytes, data=%s", len(data), self._truncate_for_logging(data))
+        data = self._truncate(data)
+
+        # Log outside the lock so readers and the reactor are not held up by handlers
         with self.lock:
-            data_size = len(data.encode('utf-8'))
-            self.logger.debug(f"Appending data: size={data_size} bytes, data={self._truncate_for_logging(data)}")
+            removed_count = self._add(data)
+        if removed_count > 0:
+            self.logger.debug("Removed %s old entries to make space", removed_count)
+        self.logger.debug("Buffer now contains %s entries, %s bytes", len(self.buffer), self.current_size)
 
-            # If single entry is larger than buffer, truncate it
-            if data_size > self.max_size_bytes:
-                self.logger.warning(f"Data size ({data_size} bytes) exceeds buffer size, truncating")
-                data = data[-self.max_size_bytes:]
-                data_size = self.max_size_bytes
+    def extend(self, lines: Iterable[Union[str, bytes]]) -> None:
+        """
+        Add several entries to the buffer at once, removing oldest entries if necessary.
 
-            # Remove oldest entries until we have space
-            removed_count = 0
-            while self.current_size + data_size > self.max_size_bytes and self.buffer:
-                removed = self.buffer.popleft()
-                removed_size = len(removed.encode('utf-8'))
-                self.current_size -= removed_size
-                removed_count += 1
+        This is like calling append() for each entry, but takes the lock only
+        once and makes room for all of the entries in one eviction pass, which
+        leaves the buffer holding the newest entries that fit. Entries that
+        later entries in the same call would push out are never stored.
 
-            if removed_count > 0:
-                self.logger.debug(f"Removed {removed_count} old entries to make space")
+        Args:
+            lines: Entries to add, each either raw UTF-8 bytes or a string
+        """
+        entries = [self._to_bytes(line) for line in lines]
+        if not entries:
+            return
+
+        self.logger.debug("Extending buffer: entries=%s", len(entries))
+        max_size = self.max_size_bytes
+        sizes = list(map(len, entries))
+        if max(sizes) > max_size:
+            # Rare; truncate oversized entries as append() would
+            entries = [self._truncate(data) for data in entries]
+            sizes = list(map(len, entries))
+
+        # Keep the longest tail of the new entries that fits on its own
+        total = sum(sizes)
+        skip = 0
+        while total > max_size:
+            total -= sizes[skip]
+            skip += 1
+        if skip:
+            entries = entries[skip:]
 
-            # Add new data
-            self.buffer.append(data)
-            self.current_size += data_size
-            self.logger.debug(f"Buffer now contains {len(self.buffer)} entries, {self.current_size} bytes")
+        with self.lock:
+            buffer = self.buffer
+            removed_count = 0
+            if skip:
+                # Older entries cannot be kept once new ones were dropped
+                removed_count = len(buffer)
+                buffer.clear()
+                new_size = total
+            else:
+                new_size = self.current_size + total
+                while new_size > max_size and buffer:
+                    new_size -= len(buffer.popleft())
+                    removed_count += 1
+
+            buffer.extend(entries)
+            self.current_size = new_size
+            self.version += 1
+
+        if removed_count > 0 or skip:
+            self.logger.debug("Removed %s old entries and skipped %s new entries to make space",
+                              removed_count, skip)
+
+        self.logger.debug("Buffer now contains %s entries, %s bytes", len(self.buffer), self.current_size)
 
     def get_lines(self, max_lines: int = 5) -> List[str]:
         """
@@ -94,16 +474,40 @@ class RingBuffer:
         Returns:
             List of the most recent lines
         """
+        self.logger.debug("Getting lines: max_lines=%s, buffer_size=%s", max_lines, len(self.buffer))
+
+        if max_lines <= 0:
+            entries = self._snapshot()
+            self.logger.debug("Returning all %s lines", len(entries))
+            return self._decode_all(entries)
+
+        # Walk back from the newest entry so only the last max_lines are copied
         with self.lock:
-            self.logger.debug(f"Getting lines: max_lines={max_lines}, buffer_size={len(self.buffer)}")
-            if max_lines <= 0:
-                self.logger.debug(f"Returning all {len(self.buffer)} lines")
-                return list(self.buffer)
-
-            # Get the last max_lines entries
-            result = list(self.buffer)[-max_lines:]
-            self.logger.debug(f"Returning {len(result)} lines")
-            return result
+            entries = list(islice(reversed(self.buffer), max_lines))
+        entries.reverse()
+        result = self._decode_all(entries)
+        self.logger.debug("Returning %s lines", len(result))
+        return result
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Iterate over all lines in the buffer, oldest first.
+
+        Unlike get_lines(0), this does not build a list of every decoded
+        line. The stored entries are captured when iter_lines() is called,
+        and are decoded a batch at a time as the iterator reaches them, so
+        a consumer that stops early does not decode the rest.
+
+        Returns:
+            Iterator over the lines
+        """
+        entries = self._snapshot()
+
+        def decode_batches():
+            for start in range(0, len(entries), SEARCH_BATCH_SIZE):
+                yield from self._decode_all(entries[start:start + SEARCH_BATCH_SIZE])
+
+        return decode_batches()
 
     def search_string(self, search_str: str, max_lines: int = 5) -> List[str]:
         """
@@ -117,30 +521,43 @@ class RingBuffer:
         Returns:
             List of matching lines or error message
         """
-        with self.lock:
-            self.logger.debug(f"Searching for string: pattern={self._truncate_for_logging(search_str)}, max_lines={max_lines}")
-
-            if search_str is None:
-                error_msg = "Search string cannot be None"
-                self.logger.error(error_msg)
-                return [f"ERROR: {error_msg}"]
-
-            try:
-                matches = [line for line in self.buffer if search_str in line]
-                self.logger.debug(f"Found {len(matches)} matches")
-            except Exception as e:
-                error_msg = f"Error during string search: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                return [f"ERROR: {error_msg}"]
-
-            if max_lines <= 0:
-                return matches
-            return matches[-max_lines:]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Searching for string: pattern=%s, max_lines=%s",
+                              self._truncate_for_logging(search_str), max_lines)
+
+        if search_str is None:
+            error_msg = "Search string cannot be None"
+            self.logger.error(error_msg)
+            return [f"ERROR: {error_msg}"]
+
+        try:
+            # Match on the raw bytes; only the returned lines are decoded
+            needle = search_str.encode('utf-8') if isinstance(search_str, str) else search_str
+            batch_test = None
+            if needle and b"\0" not in needle:
+                # One memmem over a whole batch rules out most batches without a
+                # match; the separator keeps the needle from spanning two entries
+                def batch_test(batch):
+                    return needle in b"\0".join(batch)
+            # An escaped regex gives a C-level predicate; `needle in line` needs a Python frame per line
+            contains = re.compile(re.escape(needle)).search
+            matches = self._find(contains, max_lines, decoded=False, batch_test=batch_test)
+            self.logger.debug("Found %s matches", len(matches))
+        except Exception as e:
+            error_msg = f"Error during string search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
+
+        return matches
 
     def search_regex(self, regex_pattern: Union[str, Pattern], max_lines: int = 5) -> List[str]:
         """
         Search for lines matching the specified regex pattern.
 
+        String patterns are matched against the decoded lines. A pattern
+        compiled from bytes is matched against the raw stored bytes instead,
+        which skips decoding lines that do not match.
+
         Args:
             regex_pattern: Regular expression pattern to search for
             max_lines: Maximum number of matching lines to return (default: 5)
@@ -149,73 +566,158 @@ class RingBuffer:
         Returns:
             List of matching lines
         """
-        with self.lock:
-            self.logger.debug(f"Searching with regex: pattern={self._truncate_for_logging(str(regex_pattern))}, max_lines={max_lines}")
-
-            if isinstance(regex_pattern, str):
-                try:
-                    regex_pattern = re.compile(regex_pattern)
-                except re.error as e:
-                    error_msg = f"Invalid regex pattern: {str(e)}"
-                    self.logger.error(error_msg)
-                    # Return a special error indicator that can be detected by the caller
-                    return [f"ERROR: {error_msg}"]
-                except Exception as e:
-                    error_msg = f"Unexpected error compiling regex: {str(e)}"
-                    self.logger.error(error_msg, exc_info=True)
-                    return [f"ERROR: {error_msg}"]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Searching with regex: pattern=%s, max_lines=%s",
+                              self._truncate_for_logging(str(regex_pattern)), max_lines)
 
+        if isinstance(regex_pattern, str):
             try:
-                matches = [line for line in self.buffer if regex_pattern.search(line)]
-                self.logger.debug(f"Found {len(matches)} regex matches")
+                regex_pattern, error_msg = cached_regex(regex_pattern)
             except Exception as e:
-                error_msg = f"Error during regex search: {str(e)}"
+                error_msg = f"Unexpected error compiling regex: {str(e)}"
                 self.logger.error(error_msg, exc_info=True)
                 return [f"ERROR: {error_msg}"]
+            if error_msg is not None:
+                self.logger.error(error_msg)
+                # Return a special error indicator that can be detected by the caller
+                return [f"ERROR: {error_msg}"]
+
+        try:
+            decoded = not isinstance(regex_pattern.pattern, bytes)
+            search = _line_search(regex_pattern)
+            batch_test = None
+            batch_pattern = _batch_pattern(regex_pattern)
+            if batch_pattern is not None:
+                # One regex scan over a whole batch rules out most batches without a match
+                separator = "\n" if decoded else b"\n"
+
+                def batch_test(batch):
+                    return batch_pattern.search(separator.join(batch)) is not None
 
-            if max_lines <= 0:
-                return matches
-            return matches[-max_lines:]
+            matches = self._find(search, max_lines, decoded=decoded, batch_test=batch_test)
+            self.logger.debug("Found %s regex matches", len(matches))
+        except Exception as e:
+            error_msg = f"Error during regex search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
 
-    def search_wildcard(self, wildcard_pattern: str, max_lines: int = 5) -> List[str]:
+        return matches
+
+    def search_wildcard(self, wildcard_pattern: Union[str, Pattern], max_lines: int = 5) -> List[str]:
         """
         Search for lines matching the specified wildcard pattern.
 
         Args:
-            wildcard_pattern: Wildcard pattern to search for (e.g., "*.txt")
+            wildcard_pattern: Wildcard pattern to search for (e.g., "*.txt"),
+                              or a regex already translated from one with
+                              fnmatch.translate()
             max_lines: Maximum number of matching lines to return (default: 5)
                       Use 0 to get all matching lines.
 
         Returns:
             List of matching lines or error message
         """
-        with self.lock:
-            self.logger.debug(f"Searching with wildcard: pattern={wildcard_pattern}, max_lines={max_lines}")
+        self.logger.debug("Searching with wildcard: pattern=%s, max_lines=%s", wildcard_pattern, max_lines)
+
+        if not wildcard_pattern:
+            error_msg = "Empty wildcard pattern provided"
+            self.logger.error(error_msg)
+            return [f"ERROR: {error_msg}"]
+
+        try:
+            if isinstance(wildcard_pattern, str):
+                # Translate once rather than going through fnmatch.fnmatch() per line
+                wildcard_pattern, error_msg = cached_regex(fnmatch.translate(wildcard_pattern))
+                if error_msg is not None:
+                    raise ValueError(error_msg)
+
+            # Strip whitespace from lines before matching
+            match = wildcard_pattern.match
+            matches = self._find(lambda line: match(line.strip()), max_lines, decoded=True)
+            self.logger.debug("Found %s wildcard matches", len(matches))
+        except Exception as e:
+            error_msg = f"Error in wildcard search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
+
+        return matches
+
+    def search_multi(self, patterns: List[str], max_lines: int = 5) -> List[str]:
+        """
+        Search for lines matching any of several regex patterns.
 
-            if not wildcard_pattern:
-                error_msg = "Empty wildcard pattern provided"
-                self.logger.error(error_msg)
-                return [f"ERROR: {error_msg}"]
+        When hyperscan is installed, all patterns are compiled into one
+        database and each line is scanned once, matching the patterns
+        against the raw stored bytes (lines that are not valid UTF-8 are
+        scanned as they would be decoded). Otherwise, or if hyperscan does
+        not support one of the patterns or would match it differently from
+        re, each line is tested against the patterns in turn with the regex
+        engine used by search_regex().
 
-            try:
-                # Strip whitespace from lines before matching
-                matches = [line for line in self.buffer if fnmatch.fnmatch(line.strip(), wildcard_pattern)]
-                self.logger.debug(f"Found {len(matches)} wildcard matches")
-            except Exception as e:
-                error_msg = f"Error in wildcard search: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                return [f"ERROR: {error_msg}"]
+        Args:
+            patterns: Regular expression patterns to search for
+            max_lines: Maximum number of matching lines to return (default: 5)
+                      Use 0 to get all matching lines.
 
-            if max_lines <= 0:
-                return matches
-            return matches[-max_lines:]
+        Returns:
+            List of matching lines or error message
+        """
+        self.logger.debug("Searching with %s patterns: max_lines=%s", len(patterns) if patterns else 0, max_lines)
+
+        if not patterns:
+            error_msg = "No search patterns provided"
+            self.logger.error(error_msg)
+            return [f"ERROR: {error_msg}"]
+
+        try:
+            compiled = None
+            if hyperscan is not None and not any(_HS_UNSAFE.search(pattern) for pattern in patterns):
+                compiled = _multi_database(tuple(pattern.encode('utf-8') for pattern in patterns))
+
+            if compiled is not None:
+                database, scan_lock = compiled
+                hits = []
+
+                def on_match(pattern_id, start, end, flags, context):
+                    hits.append(pattern_id)
+
+                def predicate(line):
+                    if not line.isascii():
+                        # Scan invalid UTF-8 the way the re fallback would see it
+                        line = line.decode('utf-8', 'replace').encode('utf-8')
+                    hits.clear()
+                    database.scan(line, match_event_handler=on_match)
+                    return bool(hits)
+
+                with scan_lock:
+                    matches = self._find(predicate, max_lines, decoded=False)
+            else:
+                searches = []
+                for pattern in patterns:
+                    regex, error_msg = cached_regex(pattern)
+                    if error_msg is not None:
+                        self.logger.error(error_msg)
+                        return [f"ERROR: {error_msg}"]
+                    searches.append(_line_search(regex))
+
+                matches = self._find(lambda line: any(search(line) for search in searches),
+                                     max_lines, decoded=True)
+            self.logger.debug("Found %s multi-pattern matches", len(matches))
+        except Exception as e:
+            error_msg = f"Error during multi-pattern search: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return [f"ERROR: {error_msg}"]
+
+        return matches
 
     def clear(self) -> None:
         """Clear the buffer contents."""
         with self.lock:
-            self.logger.info(f"Clearing buffer: had {len(self.buffer)} entries, {self.current_size} bytes")
+            entry_count, size = len(self.buffer), self.current_size
             self.buffer.clear()
             self.current_size = 0
+            self.version += 1
+        self.logger.info("Clearing buffer: had %s entries, %s bytes", entry_count, size)
 
     def get_size(self) -> int:
         """
@@ -225,5 +727,6 @@ class RingBuffer:
             Current buffer size in bytes
         """
         with self.lock:
-            self.logger.debug(f"Getting buffer size: {self.current_size} bytes")
-            return self.current_size
+            size = self.current_size
+        self.logger.debug("Getting buffer size: %s bytes", size)
+        return size
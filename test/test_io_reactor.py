@@ -0,0 +1,75 @@
+"""
+Tests for the IOReactor class.
+
+This module contains tests for registering and removing watched descriptors.
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from mcp_process_manager.io_reactor import IOReactor  # noqa: E402
+
+
+class _Watcher:
+    """Owner of bound-method callbacks, like the process handler's streams."""
+
+    def on_data(self, data):
+        pass
+
+    def on_ready(self):
+        pass
+
+
+class TestIOReactor(unittest.TestCase):
+    """Test cases for the IOReactor class."""
+
+    def setUp(self):
+        """Set up a private reactor and a pipe to watch."""
+        self.reactor = IOReactor()
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+
+    def tearDown(self):
+        """Close the pipe."""
+        for fd in (self.read_fd, self.write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _sync(self):
+        """Wait until the reactor has applied every change requested so far."""
+        done = threading.Event()
+        self.reactor.call_later(0, done.set)
+        self.assertTrue(done.wait(5))
+
+    def test_remove_bound_method(self):
+        """Test that a reader registered with a bound method is removed with a fresh lookup of it."""
+        for add, name in ((self.reactor.add_reader, "on_data"),
+                          (self.reactor.call_when_readable, "on_ready")):
+            watcher = _Watcher()
+            add(self.read_fd, getattr(watcher, name))
+            self._sync()
+            self.assertIn(self.read_fd, self.reactor.selector.get_map())
+
+            removed = threading.Event()
+            self.reactor.remove_reader(self.read_fd, getattr(watcher, name), removed.set)
+            self.assertTrue(removed.wait(5))
+            self.assertNotIn(self.read_fd, self.reactor.selector.get_map())
+
+    def test_remove_other_callback(self):
+        """Test that removal leaves alone a descriptor now registered by someone else."""
+        first, second = _Watcher(), _Watcher()
+        self.reactor.add_reader(self.read_fd, second.on_data)
+
+        removed = threading.Event()
+        self.reactor.remove_reader(self.read_fd, first.on_data, removed.set)
+        self.assertTrue(removed.wait(5))
+        self.assertIn(self.read_fd, self.reactor.selector.get_map())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ import unittest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 from mcp_process_manager import ProcessManager  # noqa: E402
+from mcp_process_manager.io_reactor import get_reactor  # noqa: E402
 
 
 class TestProcessManager(unittest.TestCase):
@@ -48,6 +49,24 @@ class TestProcessManager(unittest.TestCase):
         self.assertEqual(["echo", "Hello, World!"], status_info["command"])
         self.assertEqual("completed", status_info["state"])
 
+    def test_process_start_command_types(self):
+        """Test that any sequence of arguments is accepted but a bare string is not."""
+        status, pid = self.manager.process_start(("echo", "Hello"))
+        self.assertEqual("success", status)
+
+        if pid is not None:
+            self.test_pids.append(pid)
+
+        time.sleep(1)
+        self.assertEqual(["echo", "Hello"], self.manager.process_status(pid)["command"])
+
+        status, pid = self.manager.process_start("echo Hello")
+        self.assertEqual("failed: Command must be a list, got str", status)
+        self.assertIsNone(pid)
+
+        status, pid = self.manager.process_start(None)
+        self.assertTrue(status.startswith("failed:"))
+
     def test_process_status(self):
         """Test getting process status."""
         # Start a sleep process
@@ -115,6 +134,72 @@ class TestProcessManager(unittest.TestCase):
         status_info = self.manager.process_status(pid)
         self.assertIn("error", status_info["state"])
 
+    def test_process_remove_running(self):
+        """Test that removing running processes leaves the shared reader able to read new ones."""
+        # The background sleep keeps the output pipes open after the shell is killed
+        for command in (["sleep", "10"], ["sh", "-c", "sleep 5 & sleep 5"]):
+            status, pid = self.manager.process_start(command)
+            self.assertEqual("success", status)
+            time.sleep(0.2)
+            self.assertEqual("success", self.manager.process_remove(pid))
+
+            # New pipes may reuse the descriptor numbers of the removed ones
+            status, pid = self.manager.process_start(["echo", "Hello"])
+            self.assertEqual("success", status)
+            self.test_pids.append(pid)
+            time.sleep(0.5)
+            self.assertEqual(["Hello\n"], self.manager.stdio_get_lines(pid))
+
+    def test_process_remove_closed_output(self):
+        """Test that removing a process that closed its output stops watching for its exit."""
+        status, pid = self.manager.process_start(["sh", "-c", "exec >&- 2>&-; sleep 10"])
+        self.assertEqual("success", status)
+        handler = self.manager.processes[pid]
+        time.sleep(0.2)
+
+        self.assertEqual("success", self.manager.process_remove(pid))
+        time.sleep(0.2)
+
+        # Nothing registered on behalf of the handler may be left in the reactor
+        watched = [key.data[0] for key in get_reactor().selector.get_map().values() if key.data]
+        owners = [getattr(callback, "__self__", None) for callback in watched]
+        self.assertNotIn(handler, owners)
+        self.assertIsNone(handler._pidfd)
+
+    def test_partial_line(self):
+        """Test that output without a trailing newline is buffered while the process waits."""
+        status, pid = self.manager.process_start(["sh", "-c", "printf 'prompt> '; sleep 5"])
+        self.assertEqual("success", status)
+        self.test_pids.append(pid)
+
+        time.sleep(0.5)
+        self.assertEqual(["prompt> "], self.manager.stdio_get_lines(pid))
+
+    def test_exit_code(self):
+        """Test that a process's exit is noticed promptly and its exit code reported."""
+        status, pid = self.manager.process_start(["sh", "-c", "exit 3"])
+        self.assertEqual("success", status)
+        self.test_pids.append(pid)
+
+        time.sleep(0.5)
+        self.assertEqual("error: Exit code 3", self.manager.process_status(pid)["state"])
+
+    def test_exit_code_background_child(self):
+        """Test that a process's exit is recorded while a background child still holds its output open."""
+        status, pid = self.manager.process_start(["sh", "-c", "sleep 2 & exit 4"])
+        self.assertEqual("success", status)
+        self.test_pids.append(pid)
+
+        time.sleep(0.5)
+        # Read the state directly, since process_status() would poll the process itself
+        self.assertEqual("error: Exit code 4", self.manager.processes[pid].state)
+
+        # all_kill leaves the exited process and its exit code alone, and all_remove removes it
+        self.assertEqual("success", self.manager.all_kill())
+        self.assertEqual("error: Exit code 4", self.manager.process_status(pid)["state"])
+        self.assertEqual("success", self.manager.all_remove())
+        self.assertNotIn(pid, self.manager.processes)
+
     def test_process_list(self):
         """Test listing all processes."""
         # Start multiple processes
@@ -198,6 +283,28 @@ class TestProcessManager(unittest.TestCase):
         status_info2 = self.manager.process_status(pid2)
         self.assertEqual("running", status_info2["state"])
 
+    def test_shutdown(self):
+        """Test that shutdown kills and stops tracking every process."""
+        status, pid = self.manager.process_start(["sleep", "10"])
+        self.assertEqual("success", status)
+        handler = self.manager.processes[pid]
+
+        self.manager.shutdown()
+        self.assertEqual([], self.manager.process_list())
+        self.assertIsNotNone(handler.process.poll())
+
+        # The manager can still kill processes started after shutdown
+        status, pid = self.manager.process_start(["sleep", "10"])
+        self.assertEqual("success", status)
+        self.assertEqual("success", self.manager.all_kill())
+
+        # A second call tears down processes started in between
+        status, pid = self.manager.process_start(["sleep", "10"])
+        handler = self.manager.processes[pid]
+        self.manager.shutdown()
+        self.assertEqual([], self.manager.process_list())
+        self.assertIsNotNone(handler.process.poll())
+
     def test_stdio_get_lines(self):
         """Test getting output lines from a process."""
         # Start a process with output
@@ -284,6 +391,28 @@ class TestProcessManager(unittest.TestCase):
         # Kill the process
         self.manager.process_kill(pid)
 
+    def test_stdio_send_bytes(self):
+        """Test sending bytes to a process without re-encoding."""
+        status, pid = self.manager.process_start(["cat"])
+
+        # Check if process started successfully
+        self.assertEqual("success", status)
+        self.assertIsNotNone(pid)
+
+        if pid is not None:
+            self.test_pids.append(pid)
+
+        # Send a line and raw characters as bytes
+        self.assertEqual("success", self.manager.stdio_send_line(pid, b"Bytes line"))
+        self.assertEqual("success", self.manager.stdio_send_chars(pid, b"caf\xc3\xa9\n"))
+
+        # Wait for process to process input
+        time.sleep(1)
+
+        # Check that input was echoed
+        lines = self.manager.stdio_get_lines(pid)
+        self.assertEqual(["Bytes line\n", "café\n"], lines)
+
     def test_search_functionality(self):
         """Test searching process output."""
         # Start a process with searchable output
@@ -358,6 +487,43 @@ class TestProcessManager(unittest.TestCase):
             elif pid == pid2:
                 self.assertTrue(any("Process2: Alpha" in line for line in lines))
 
+    def test_all_search_invalid_regex(self):
+        """Test that an invalid regex is reported once for all processes."""
+        status, pid = self.manager.process_start(["echo", "Alpha"])
+        self.assertEqual("success", status)
+
+        if pid is not None:
+            self.test_pids.append(pid)
+
+        search_results = self.manager.all_search("regex", "(")
+        self.assertEqual(1, len(search_results))
+        self.assertEqual(-1, search_results[0][0])
+        self.assertTrue(search_results[0][1][0].startswith("ERROR: Invalid regex pattern"))
+
+        # Patterns of the wrong type are reported rather than raised
+        for search_type, pattern in [("regex", 123), ("wildcard", b"hi*")]:
+            search_results = self.manager.all_search(search_type, pattern)
+            self.assertEqual(1, len(search_results))
+            self.assertEqual(-1, search_results[0][0])
+            self.assertTrue(search_results[0][1][0].startswith("ERROR:"))
+
+    def test_all_search_sees_new_output(self):
+        """Test that repeated searches pick up output added in between."""
+        status, pid = self.manager.process_start(["cat"])
+        self.assertEqual("success", status)
+
+        if pid is not None:
+            self.test_pids.append(pid)
+
+        self.manager.stdio_send_line(pid, "match 1")
+        time.sleep(0.5)
+        self.assertEqual([(pid, ["match 1\n"])], self.manager.all_search("string", "match", 0))
+        self.assertEqual([(pid, ["match 1\n"])], self.manager.all_search("string", "match", 0))
+
+        self.manager.stdio_send_line(pid, "match 2")
+        time.sleep(0.5)
+        self.assertEqual([(pid, ["match 1\n", "match 2\n"])], self.manager.all_search("string", "match", 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for the RingBuffer class.
+
+This module contains tests for storing, retrieving and searching buffered output.
+"""
+
+import os
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from mcp_process_manager import RingBuffer  # noqa: E402
+from mcp_process_manager.ring_buffer import compile_regex, re2, hyperscan, _multi_database  # noqa: E402
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Test cases for the RingBuffer class."""
+
+    def test_append_bytes_and_str(self):
+        """Test that bytes and strings are both returned as decoded lines."""
+        buffer = RingBuffer(max_size_bytes=1024)
+        buffer.append(b"caf\xc3\xa9\n")
+        buffer.append("thé\n")
+        buffer.append(b"bad \xff\n")
+
+        self.assertEqual(["café\n", "thé\n", "bad �\n"], buffer.get_lines(0))
+        self.assertEqual(len("café\nthé\nbad \xff\n".encode('utf-8')) - 1, buffer.get_size())
+
+    def test_eviction(self):
+        """Test that the oldest entries are evicted when the buffer is full."""
+        buffer = RingBuffer(max_size_bytes=10)
+        buffer.append("1234\n")
+        buffer.append("5678\n")
+        buffer.append("abcd\n")
+
+        self.assertEqual(["5678\n", "abcd\n"], buffer.get_lines(0))
+        self.assertEqual(10, buffer.get_size())
+
+    def test_extend(self):
+        """Test that extend() stores entries like repeated append() calls."""
+        buffer = RingBuffer(max_size_bytes=10)
+        buffer.extend([b"1234\n", "5678\n", b"abcd\n"])
+
+        self.assertEqual(["5678\n", "abcd\n"], buffer.get_lines(0))
+        self.assertEqual(10, buffer.get_size())
+
+        # New entries that do not fit together push out everything older
+        buffer.extend(["a\n", "bcdefghi\n"])
+        self.assertEqual(["bcdefghi\n"], buffer.get_lines(0))
+        self.assertEqual(9, buffer.get_size())
+
+    def test_iter_lines(self):
+        """Test that iter_lines() yields the lines present when it was called."""
+        buffer = RingBuffer(max_size_bytes=1024 * 1024)
+        buffer.extend(f"line {i}\n" for i in range(3000))
+
+        lines = buffer.iter_lines()
+        buffer.append("later\n")
+        self.assertEqual([f"line {i}\n" for i in range(3000)], list(lines))
+        self.assertEqual(buffer.get_lines(0), list(buffer.iter_lines()))
+
+    def test_search(self):
+        """Test string, regex and wildcard searches over buffered lines."""
+        buffer = RingBuffer(max_size_bytes=1024)
+        for line in ["Alpha\n", "Beta\n", "Gämma\n", "Delta\n"]:
+            buffer.append(line)
+
+        self.assertEqual(["Gämma\n"], buffer.search_string("äm"))
+        self.assertEqual(["Beta\n", "Delta\n"], buffer.search_regex("ta$", 0))
+        self.assertEqual(["Delta\n"], buffer.search_regex(re.compile(b"^D"), 0))
+        self.assertEqual(["Alpha\n"], buffer.search_wildcard("A*"))
+        self.assertTrue(buffer.search_regex("(")[0].startswith("ERROR:"))
+        # Cached patterns, valid or not, give the same results again
+        self.assertEqual(["Beta\n", "Delta\n"], buffer.search_regex("ta$", 0))
+        self.assertEqual(buffer.search_regex("("), buffer.search_regex("("))
+
+    def test_search_across_batches(self):
+        """Test that searches spanning many batches find the same lines as a plain scan."""
+        buffer = RingBuffer(max_size_bytes=1024 * 1024)
+        lines = [f"line {i}\n" for i in range(5000)] + ["partial"]
+        buffer.extend(lines)
+
+        for pattern in ["^line 1", "9$", "^partial$", "(?<=line )42\\b", "\\Aline 4999",
+                        "(?-m:^line 4)", "(?s)line 3.$", "9\\s*+$", "9(?>\\s*)$"]:
+            expected = [line for line in lines if re.search(pattern, line)]
+            self.assertEqual(expected, buffer.search_regex(pattern, 0), pattern)
+            self.assertEqual(expected[-3:], buffer.search_regex(pattern, 3), pattern)
+        self.assertEqual(["line 4242\n"], buffer.search_string("4242\n", 0))
+        self.assertEqual(["partial"], buffer.search_string("partial", 1))
+
+    @unittest.skipUnless(re2, "google-re2 is not installed")
+    def test_search_regex_re2(self):
+        """Test that regex searches find the same lines whether or not re2 compiles the pattern."""
+        buffer = RingBuffer(max_size_bytes=1024)
+        lines = ["Beta\n", "Gämma 3\n", "\n", "naïve word\n", "aa\n", "\u212a\n", "partial"]
+        buffer.extend(lines)
+
+        for pattern in ["ta$", "\\w+ä", "\\bword\\b", "ïve\\b", "\\d", "a{,2}", "(?i)k", "ä+m", "^pa.t",
+                        "^a*$", "^$", "[\\t-\\r]$", "[^a]$", "(^|a)a$"]:
+            expected = [line for line in lines if re.search(pattern, line)]
+            self.assertEqual(expected, buffer.search_regex(pattern, 0), pattern)
+            self.assertEqual(expected[-2:], buffer.search_regex(pattern, 2), pattern)
+
+        # Patterns that mean the same in both engines are compiled with re2
+        self.assertNotIsInstance(compile_regex("ä+m"), re.Pattern)
+        self.assertNotIsInstance(compile_regex("ta$"), re.Pattern)
+        self.assertIsInstance(compile_regex("[^a]$"), re.Pattern)
+
+        # Nested repeats do not backtrack catastrophically
+        buffer.append("a" * 40 + "b\n")
+        self.assertEqual(["aa\n"], buffer.search_regex("^(a+)+$", 0))
+
+    def test_search_multi(self):
+        """Test searching for lines matching any of several patterns."""
+        buffer = RingBuffer(max_size_bytes=1024)
+        buffer.extend(["INFO start\n", "WARN disk\n", "ERROR boom\n", "INFO done\n"])
+
+        self.assertEqual(["WARN disk\n", "ERROR boom\n"], buffer.search_multi(["^WARN", "ERROR"], 0))
+        self.assertEqual(["WARN disk\n", "INFO done\n"], buffer.search_multi(["disk$", "^INFO d"], 0))
+        self.assertEqual(["ERROR boom\n"], buffer.search_multi(["^WARN", "ERROR"], 1))
+        self.assertTrue(buffer.search_multi([])[0].startswith("ERROR:"))
+        self.assertTrue(buffer.search_multi(["ok", "("])[0].startswith("ERROR:"))
+
+
+    @unittest.skipUnless(hyperscan, "hyperscan is not installed")
+    def test_search_multi_hyperscan(self):
+        """Test that multi-pattern searches find the same lines whether or not hyperscan runs them."""
+        buffer = RingBuffer(max_size_bytes=1024)
+        lines = [b"caf\xc3\xa9 bar\n", b"\n", b"x\xffy\n", "Stra\u00dfe\n".encode(), b"\xe2\x80\x83k\n",
+                 b"K\x1c\n", b"partial"]
+        buffer.extend(lines)
+        decoded = [line.decode("utf-8", "replace") for line in lines]
+
+        for patterns in [["é b", "^$"], ["x.y", "ß+e$"], ["[à-ü]"], ["y?"], ["\\w\\w*k"], ["\\s$", "(?i)k"]]:
+            expected = [line for line in decoded if any(re.search(pattern, line) for pattern in patterns)]
+            self.assertEqual(expected, buffer.search_multi(patterns, 0), patterns)
+
+        # Patterns that mean the same in both engines are searched with hyperscan
+        self.assertIsNotNone(_multi_database(("x.y".encode(), "ß+e$".encode())))
+
+
+if __name__ == "__main__":
+    unittest.main()